@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import importlib
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
+from typing import Any
 
 import click
 
@@ -19,13 +22,84 @@ from workflow_tools.common import (
     style_success,
     style_warn,
 )
-from workflow_tools.pr.cli import cli as pr_cli
-from workflow_tools.rp.cli import cli as rp_cli
-from workflow_tools.tm.cli import cli as tm_cli
-from workflow_tools.wt.cli import cli as wt_cli
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports subcommand groups on first use.
+
+    Each tool pulls in its own dependencies, so importing all of them up front
+    slows down every invocation (including --help and install --print). The
+    short help shown in --help is stored alongside each import path so that
+    listing the commands doesn't import them either.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        lazy_subcommands: dict[str, tuple[str, str]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        # Maps command name -> ("module.path:attribute", short help)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load_lazy(cmd_name), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """List commands like click does, without loading lazy ones."""
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = []
+        for name in names:
+            if name in self.lazy_subcommands and name not in self.commands:
+                rows.append((name, self.lazy_subcommands[name][1]))
+                continue
+            cmd = self.get_command(ctx, name)
+            if cmd is not None and not cmd.hidden:
+                rows.append((name, cmd.get_short_help_str(limit)))
+        with formatter.section("Commands"):
+            formatter.write_dl(rows)
+
+    def _load_lazy(self, cmd_name: str) -> click.Command:
+        module_name, attr = self.lazy_subcommands[cmd_name][0].split(":", 1)
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            msg = f"Lazy subcommand {cmd_name!r} is not a click.Command"
+            raise TypeError(msg)
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "wt": (
+            "workflow_tools.wt.cli:cli",
+            "Git worktree manager with interactive selection.",
+        ),
+        "pr": (
+            "workflow_tools.pr.cli:cli",
+            "GitHub PR management with interactive selection.",
+        ),
+        "rp": (
+            "workflow_tools.rp.cli:cli",
+            "Repository management with fast discovery.",
+        ),
+        "tm": (
+            "workflow_tools.tm.cli:cli",
+            "Tmux session manager with git-aware naming.",
+        ),
+    },
+)
 @click.version_option(package_name="workflow-tools")
 def cli() -> None:
     """Workflow tools: git worktrees, PRs, repositories, and tmux sessions.
@@ -48,11 +122,12 @@ def cli() -> None:
     """
 
 
-# Add subcommand groups
-cli.add_command(wt_cli, name="wt")
-cli.add_command(pr_cli, name="pr")
-cli.add_command(rp_cli, name="rp")
-cli.add_command(tm_cli, name="tm")
+# rc file line that sources the integration file written by install
+_INSTALL_MARKER = "workflow-tools/shell-integration.sh"
+
+# Older installs eval'd `workflow-tools install --print` on every shell start;
+# install rewrites that line to source the integration file instead
+_LEGACY_INSTALL_MARKER = "workflow-tools install --print"
 
 
 @cli.command()
@@ -71,7 +146,9 @@ cli.add_command(tm_cli, name="tm")
 def install(shell: str, *, print_only: bool) -> None:
     """Install shell integration (cd support + aliases).
 
-    Adds aliases for wt, pr, rp with cd support for wt and rp.
+    Adds aliases for wt, pr, rp with cd support for wt and rp. The wrapper is
+    written to ~/.config/workflow-tools/shell-integration.sh, which your shell
+    rc file sources; re-run install to refresh it.
 
     EXAMPLES:
         workflow-tools install              # Auto-detect shell
@@ -91,48 +168,61 @@ def install(shell: str, *, print_only: bool) -> None:
             )
             sys.exit(1)
 
-    wrapper = _get_shell_wrapper(shell)
+    wrapper = _get_shell_wrapper()
 
     if print_only:
         click.echo(wrapper)
         return
 
-    # Determine config file
+    # Write the wrapper to a static file so shell startup doesn't have to
+    # launch Python to regenerate it
     home = Path.home()
+    integration_file = _integration_file()
+    integration_file.parent.mkdir(parents=True, exist_ok=True)
+    integration_file.write_text(wrapper)
+
+    # Determine config file
     config_file = home / ".zshrc" if shell == "zsh" else home / ".bashrc"
+    integration = f"$HOME/{integration_file.relative_to(home)}"
+    source_line = f'[ -f "{integration}" ] && source "{integration}"'
     # Ensure ~/.local/bin is in PATH before running workflow-tools
-    install_block = """# workflow-tools shell integration
+    install_block = f"""# workflow-tools shell integration
 export PATH="$HOME/.local/bin:$PATH"
-eval "$(workflow-tools install --print)\""""
-
-    # Check if already installed
-    source_cmd = f"source {config_file}"
-    if config_file.exists():
-        content = config_file.read_text()
-        if "workflow-tools install --print" in content:
-            click.echo(style_info(f"Already installed in {config_file}"))
-            click.echo(style_dim(f"  Restart your shell or run: {source_cmd}"))
-            if copy_to_clipboard(source_cmd):
-                click.echo(style_dim("  (copied to clipboard)"))
-            return
+{source_line}"""
 
-    # Append to config
-    with config_file.open("a") as f:
-        f.write(f"\n{install_block}\n")
+    lines = (
+        config_file.read_text().splitlines(keepends=True)
+        if config_file.exists()
+        else []
+    )
+    if any(_INSTALL_MARKER in line for line in lines):
+        click.echo(style_info(f"Already installed in {config_file}"))
+    elif any(_LEGACY_INSTALL_MARKER in line for line in lines):
+        # Swap the eval line in place so the rest of the rc file is untouched
+        config_file.write_text(
+            "".join(
+                (
+                    line[: len(line) - len(line.lstrip())] + source_line + "\n"
+                    if _LEGACY_INSTALL_MARKER in line
+                    else line
+                )
+                for line in lines
+            )
+        )
+        click.echo(style_success(f"Updated {config_file} to source {integration}"))
+    else:
+        with config_file.open("a") as f:
+            f.write(f"\n{install_block}\n")
+        click.echo(style_success(f"Installed to {config_file}"))
 
-    click.echo(style_success(f"Installed to {config_file}"))
+    source_cmd = f"source {config_file}"
     click.echo(style_dim(f"  Restart your shell or run: {source_cmd}"))
     if copy_to_clipboard(source_cmd):
         click.echo(style_dim("  (copied to clipboard)"))
 
 
-def _get_shell_wrapper(shell: str) -> str:
-    """Get shell wrapper script with aliases."""
-    # Find the binary location
-    binary = _find_binary()
-
-    if shell == "zsh":
-        return f"""
+# Shell functions installed by `install`; {binary} is the workflow-tools path
+_SHELL_WRAPPER_TEMPLATE = """
 # workflow-tools shell integration
 export WT_CD_FILE="${{TMPDIR:-/tmp}}/.wt_cd_$$"
 export WT_ENV_FILE="${{TMPDIR:-/tmp}}/.wt_env_$$"
@@ -186,71 +276,48 @@ tm() {{
     "{binary}" tm "$@"
 }}
 """
-    # bash
-    return f"""
-# workflow-tools shell integration
-export WT_CD_FILE="${{TMPDIR:-/tmp}}/.wt_cd_$$"
-export WT_ENV_FILE="${{TMPDIR:-/tmp}}/.wt_env_$$"
-export RP_CD_FILE="${{TMPDIR:-/tmp}}/.rp_cd_$$"
 
-# wt: worktree management with cd and env support
-wt() {{
-    # Clean up temp files from any previous run
-    rm -f "$WT_CD_FILE" "$WT_ENV_FILE"
 
-    # Run the actual command
-    "{binary}" wt "$@"
-    local exit_code=$?
+def _get_shell_wrapper() -> str:
+    """Get shell wrapper script with aliases (same script for zsh and bash)."""
+    return _SHELL_WRAPPER_TEMPLATE.format(binary=_find_binary())
 
-    # Source any env vars the command wants to set in the parent shell
-    # (e.g., WT_GITIGNORE_SKIP to remember user declined gitignore prompt)
-    [[ -f "$WT_ENV_FILE" ]] && source "$WT_ENV_FILE" && rm -f "$WT_ENV_FILE"
 
-    # Change directory if the command requested it (e.g., wt switch)
-    [[ -f "$WT_CD_FILE" ]] && cd "$(cat "$WT_CD_FILE")" && rm -f "$WT_CD_FILE"
+def _integration_file() -> Path:
+    """Path of the generated wrapper that shell rc files source."""
+    return Path.home() / ".config" / "workflow-tools" / "shell-integration.sh"
 
-    return $exit_code
-}}
-
-# pr: pull request management with cd support (for pr checkout)
-pr() {{
-    rm -f "$WT_CD_FILE"
-    "{binary}" pr "$@"
-    local exit_code=$?
-    if [[ -f "$WT_CD_FILE" ]]; then
-        cd "$(cat "$WT_CD_FILE")"
-        rm -f "$WT_CD_FILE"
-    fi
-    return $exit_code
-}}
 
-# rp: repository management with cd support
-rp() {{
-    rm -f "$RP_CD_FILE"
-    "{binary}" rp "$@"
-    local exit_code=$?
-    if [[ -f "$RP_CD_FILE" ]]; then
-        cd "$(cat "$RP_CD_FILE")"
-        rm -f "$RP_CD_FILE"
-    fi
-    return $exit_code
-}}
+def _refresh_integration_file() -> None:
+    """Regenerate an installed integration file from the current binary.
 
-# tm: tmux session management
-tm() {{
-    "{binary}" tm "$@"
-}}
-"""
+    Runs the freshly installed binary rather than this process, whose wrapper
+    template may predate the update.
+    """
+    integration_file = _integration_file()
+    if not integration_file.exists():
+        return
+    result = subprocess.run(
+        [_find_binary(), "install", "--print"],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0 or not result.stdout.strip():
+        click.echo(
+            style_warn(
+                "Could not refresh shell integration; run: workflow-tools install"
+            ),
+            err=True,
+        )
+        return
+    integration_file.write_text(result.stdout)
+    click.echo(style_dim(f"  Refreshed {integration_file}"))
 
 
 def _find_binary() -> str:
     """Find the workflow-tools binary location."""
-    result = subprocess.run(
-        ["which", "workflow-tools"], capture_output=True, text=True, check=False
-    )
-    if result.returncode == 0:
-        return result.stdout.strip()
-    return "workflow-tools"
+    return shutil.which("workflow-tools") or "workflow-tools"
 
 
 @cli.command()
@@ -299,7 +366,8 @@ GITHUB_REPO = "emmapowers/workflow-tools"
 def update() -> None:
     """Update workflow-tools to the latest version.
 
-    Pulls the latest code from the main branch and reinstalls.
+    Pulls the latest code from the main branch and reinstalls, then
+    regenerates the shell integration file if install wrote one.
 
     EXAMPLES:
         workflow-tools update
@@ -318,6 +386,7 @@ def update() -> None:
     )
     if result.returncode == 0:
         click.echo(style_success("Updated to latest!"))
+        _refresh_integration_file()
     else:
         click.echo(style_error("Update failed"), err=True)
         sys.exit(1)
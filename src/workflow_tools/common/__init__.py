@@ -1,63 +1,127 @@
-"""Shared utilities for workflow tools."""
+"""Shared utilities for workflow tools.
 
-from workflow_tools.common.color import (
-    COLOR_PRESETS,
-    WORKSPACE_GITIGNORE_PATTERN,
-    add_pattern_to_gitignore,
-    create_workspace_file,
-    delete_workspace_file,
-    find_workspace_file,
-    get_random_preset,
-    is_pattern_in_gitignore,
-    read_workspace_color,
-    resolve_color,
-    set_iterm_tab_color,
-)
-from workflow_tools.common.direnv import (
-    SetupResult,
-    detect_env_manager,
-    get_direnv_install_hint,
-    get_envrc_content,
-    is_direnv_installed,
-    setup_direnv,
-)
-from workflow_tools.common.git import (
-    find_repo_root,
-    get_current_branch,
-    get_default_branch,
-    list_branches,
-    require_repo,
-    run_git,
-)
-from workflow_tools.common.github import run_gh
-from workflow_tools.common.shell import copy_to_clipboard, output_cd, output_env
-from workflow_tools.common.ui import (
-    BOLD,
-    CYAN,
-    DIM,
-    GREEN,
-    RED,
-    YELLOW,
-    fuzzy_select,
-    select_from_menu,
-    style_dim,
-    style_error,
-    style_info,
-    style_success,
-    style_warn,
-)
-from workflow_tools.common.validate import (
-    ValidationError,
-    parse_github_url,
-    validate_branch_name,
-    validate_github_owner,
-    validate_github_repo,
-    validate_path_no_traversal,
-    validate_pr_number,
-    validate_temp_path,
-    validate_tmux_session_name,
-    validate_worktree_name,
-)
+Names are resolved lazily (PEP 562) so that importing one helper only loads
+the submodule that defines it.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from workflow_tools.common.color import (
+        COLOR_PRESETS,
+        WORKSPACE_GITIGNORE_PATTERN,
+        add_pattern_to_gitignore,
+        create_workspace_file,
+        delete_workspace_file,
+        find_workspace_file,
+        get_random_preset,
+        is_pattern_in_gitignore,
+        read_workspace_color,
+        resolve_color,
+        set_iterm_tab_color,
+    )
+    from workflow_tools.common.direnv import (
+        SetupResult,
+        detect_env_manager,
+        get_direnv_install_hint,
+        get_envrc_content,
+        is_direnv_installed,
+        setup_direnv,
+    )
+    from workflow_tools.common.git import (
+        find_repo_root,
+        get_current_branch,
+        get_default_branch,
+        list_branches,
+        require_repo,
+        run_git,
+    )
+    from workflow_tools.common.github import run_gh
+    from workflow_tools.common.shell import copy_to_clipboard, output_cd, output_env
+    from workflow_tools.common.ui import (
+        BOLD,
+        CYAN,
+        DIM,
+        GREEN,
+        RED,
+        YELLOW,
+        fuzzy_select,
+        select_from_menu,
+        style_dim,
+        style_error,
+        style_info,
+        style_success,
+        style_warn,
+    )
+    from workflow_tools.common.validate import (
+        ValidationError,
+        parse_github_url,
+        validate_branch_name,
+        validate_github_owner,
+        validate_github_repo,
+        validate_path_no_traversal,
+        validate_pr_number,
+        validate_temp_path,
+        validate_tmux_session_name,
+        validate_worktree_name,
+    )
+
+# Exported name -> submodule of workflow_tools.common that defines it
+_ATTR_TO_MODULE: dict[str, str] = {
+    "COLOR_PRESETS": "color",
+    "WORKSPACE_GITIGNORE_PATTERN": "color",
+    "add_pattern_to_gitignore": "color",
+    "create_workspace_file": "color",
+    "delete_workspace_file": "color",
+    "find_workspace_file": "color",
+    "get_random_preset": "color",
+    "is_pattern_in_gitignore": "color",
+    "read_workspace_color": "color",
+    "resolve_color": "color",
+    "set_iterm_tab_color": "color",
+    "SetupResult": "direnv",
+    "detect_env_manager": "direnv",
+    "get_direnv_install_hint": "direnv",
+    "get_envrc_content": "direnv",
+    "is_direnv_installed": "direnv",
+    "setup_direnv": "direnv",
+    "find_repo_root": "git",
+    "get_current_branch": "git",
+    "get_default_branch": "git",
+    "list_branches": "git",
+    "require_repo": "git",
+    "run_git": "git",
+    "run_gh": "github",
+    "copy_to_clipboard": "shell",
+    "output_cd": "shell",
+    "output_env": "shell",
+    "BOLD": "ui",
+    "CYAN": "ui",
+    "DIM": "ui",
+    "GREEN": "ui",
+    "RED": "ui",
+    "YELLOW": "ui",
+    "fuzzy_select": "ui",
+    "select_from_menu": "ui",
+    "style_dim": "ui",
+    "style_error": "ui",
+    "style_info": "ui",
+    "style_success": "ui",
+    "style_warn": "ui",
+    "ValidationError": "validate",
+    "parse_github_url": "validate",
+    "validate_branch_name": "validate",
+    "validate_github_owner": "validate",
+    "validate_github_repo": "validate",
+    "validate_path_no_traversal": "validate",
+    "validate_pr_number": "validate",
+    "validate_temp_path": "validate",
+    "validate_tmux_session_name": "validate",
+    "validate_worktree_name": "validate",
+}
 
 __all__ = [
     "BOLD",
@@ -111,3 +175,17 @@ __all__ = [
     "validate_tmux_session_name",
     "validate_worktree_name",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _ATTR_TO_MODULE.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return list(__all__)
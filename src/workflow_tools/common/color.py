@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import random
 import subprocess
 import sys
 from pathlib import Path
 
+from workflow_tools.common.git import git_bin
+
 # Constants for hex color validation
 _HEX_COLOR_LENGTH = 6
 _LUMINANCE_THRESHOLD = 0.5
 
+# Luminance weights scaled by 1000 so the check stays in integer math
+_LUM_R, _LUM_G, _LUM_B = 299, 587, 114
+_LUMINANCE_THRESHOLD_SCALED = int(255 * 1000 * _LUMINANCE_THRESHOLD)
+
 # Gitignore pattern for workspace files
 WORKSPACE_GITIGNORE_PATTERN = "*.local.code-workspace"
 
@@ -45,32 +53,32 @@ def resolve_color(color: str) -> str | None:
     return None
 
 
+def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
+    """Split a 6-digit hex color (with or without #) into (r, g, b)."""
+    value = int(hex_color.lstrip("#"), 16)
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+
 def darken_color(hex_color: str, percent: int = 50) -> str:
     """Darken a hex color by percentage."""
-    hex_color = hex_color.lstrip("#")
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    r, g, b = _hex_to_rgb(hex_color)
 
-    factor = (100 - percent) / 100
-    r = int(r * factor)
-    g = int(g * factor)
-    b = int(b * factor)
+    factor = 100 - percent
+    r = r * factor // 100
+    g = g * factor // 100
+    b = b * factor // 100
 
     return f"{r:02X}{g:02X}{b:02X}"
 
 
 def foreground_for(hex_color: str) -> str:
     """Return #000000 or #FFFFFF based on luminance."""
-    hex_color = hex_color.lstrip("#")
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
+    r, g, b = _hex_to_rgb(hex_color)
 
-    # Calculate relative luminance
-    luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
+    # Relative luminance in integer thousandths: (0.299 R + 0.587 G + 0.114 B)
+    luminance = _LUM_R * r + _LUM_G * g + _LUM_B * b
 
-    return "#000000" if luminance > _LUMINANCE_THRESHOLD else "#FFFFFF"
+    return "#000000" if luminance > _LUMINANCE_THRESHOLD_SCALED else "#FFFFFF"
 
 
 def set_iterm_tab_color(hex_color: str | None) -> None:
@@ -79,14 +87,14 @@ def set_iterm_tab_color(hex_color: str | None) -> None:
         # Reset tab color
         sys.stdout.write("\033]6;1;bg;*;default\a")
     else:
-        hex_color = hex_color.lstrip("#")
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-
-        sys.stdout.write(f"\033]6;1;bg;red;brightness;{r}\a")
-        sys.stdout.write(f"\033]6;1;bg;green;brightness;{g}\a")
-        sys.stdout.write(f"\033]6;1;bg;blue;brightness;{b}\a")
+        r, g, b = _hex_to_rgb(hex_color)
+
+        # All three channels in one write
+        sys.stdout.write(
+            f"\033]6;1;bg;red;brightness;{r}\a"
+            f"\033]6;1;bg;green;brightness;{g}\a"
+            f"\033]6;1;bg;blue;brightness;{b}\a"
+        )
     sys.stdout.flush()
 
 
@@ -102,14 +110,9 @@ def get_workspace_filename(branch: str) -> str:
     return f"{safe_name}.local.code-workspace"
 
 
-def create_workspace_file(worktree_path: Path, hex_color: str) -> Path:
-    """Create .local.code-workspace file with color settings. Returns the file path."""
-    # Get branch name for filename
-    branch = _get_branch_from_worktree(worktree_path)
-    filename = get_workspace_filename(branch)
-    workspace_path = worktree_path / filename
-
-    hex_color = hex_color.lstrip("#")
+@functools.lru_cache(maxsize=len(COLOR_PRESETS) + 16)
+def _workspace_bytes(hex_color: str) -> bytes:
+    """Serialized workspace file contents for a color (no #)."""
     fg_color = foreground_for(hex_color)
     dark_color = darken_color(hex_color, 50)
 
@@ -126,10 +129,17 @@ def create_workspace_file(worktree_path: Path, hex_color: str) -> Path:
             }
         },
     }
+    return json.dumps(workspace_content, indent=2).encode() + b"\n"
 
-    with open(workspace_path, "w") as f:
-        json.dump(workspace_content, f, indent=2)
-        f.write("\n")
+
+def create_workspace_file(worktree_path: Path, hex_color: str) -> Path:
+    """Create .local.code-workspace file with color settings. Returns the file path."""
+    # Get branch name for filename
+    branch = _get_branch_from_worktree(worktree_path)
+    filename = get_workspace_filename(branch)
+    workspace_path = worktree_path / filename
+
+    workspace_path.write_bytes(_workspace_bytes(hex_color.lstrip("#")))
 
     return workspace_path
 
@@ -158,10 +168,7 @@ def read_workspace_color(worktree_path: Path) -> str | None:
 
 def find_workspace_file(worktree_path: Path) -> Path | None:
     """Find .local.code-workspace file in directory."""
-    for file in worktree_path.iterdir():
-        if file.name.endswith(".local.code-workspace"):
-            return file
-    return None
+    return next(worktree_path.glob("*.local.code-workspace"), None)
 
 
 def delete_workspace_file(worktree_path: Path) -> bool:
@@ -176,7 +183,7 @@ def delete_workspace_file(worktree_path: Path) -> bool:
 def _get_branch_from_worktree(worktree_path: Path) -> str:
     """Get branch name from worktree path (for filename generation)."""
     result = subprocess.run(
-        ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+        [git_bin(), "rev-parse", "--abbrev-ref", "HEAD"],
         cwd=worktree_path,
         capture_output=True,
         text=True,
@@ -187,52 +194,41 @@ def _get_branch_from_worktree(worktree_path: Path) -> str:
     return "default"
 
 
-def _get_repo_root(worktree_path: Path) -> Path | None:
-    """Get the repository root from a worktree path."""
-    result = subprocess.run(
-        ["git", "rev-parse", "--show-toplevel"],
-        cwd=worktree_path,
-        capture_output=True,
-        text=True,
-        check=False,
+@functools.lru_cache(maxsize=32)
+def _gitignore_lines(path: str, mtime_ns: int, size: int) -> frozenset[str]:
+    """Stripped, non-empty .gitignore lines (keyed by mtime/size to invalidate)."""
+    content = Path(path).read_text()
+    return frozenset(
+        stripped for line in content.splitlines() if (stripped := line.strip())
     )
-    if result.returncode == 0:
-        return Path(result.stdout.strip())
-    return None
 
 
 def is_pattern_in_gitignore(repo_root: Path, pattern: str) -> bool:
     """Check if a pattern exists in .gitignore."""
     gitignore_path = repo_root / ".gitignore"
-    if not gitignore_path.exists():
-        return False
-
     try:
-        content = gitignore_path.read_text()
+        st = gitignore_path.stat()
         # Check for exact line match (ignoring leading/trailing whitespace)
-        for line in content.splitlines():
-            if line.strip() == pattern:
-                return True
+        lines = _gitignore_lines(str(gitignore_path), st.st_mtime_ns, st.st_size)
     except OSError:
-        pass
-
-    return False
+        return False
+    return pattern in lines
 
 
 def add_pattern_to_gitignore(repo_root: Path, pattern: str) -> None:
     """Append a pattern to .gitignore, creating file if needed."""
     gitignore_path = repo_root / ".gitignore"
 
-    # Read existing content
-    if gitignore_path.exists():
-        content = gitignore_path.read_text()
-        # Ensure file ends with newline before appending
-        if content and not content.endswith("\n"):
-            content += "\n"
-    else:
-        content = ""
-
-    # Append pattern with blank line and comment
-    content += "\n# Auto-generated by wt (workflow-tools)\n"
-    content += f"{pattern}\n"
-    gitignore_path.write_text(content)
+    with gitignore_path.open("a+b") as f:
+        # Ensure file ends with newline before appending (only the last byte
+        # needs checking, not the whole file)
+        prefix = b""
+        end = f.seek(0, os.SEEK_END)
+        if end > 0:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                prefix = b"\n"
+
+        # Append pattern with blank line and comment
+        f.write(prefix + b"\n# Auto-generated by wt (workflow-tools)\n")
+        f.write(f"{pattern}\n".encode())
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -11,15 +14,23 @@ import click
 from workflow_tools.common.ui import style_error, style_info
 
 
+@functools.cache
+def git_bin() -> str:
+    """Absolute path to git, resolved once so each spawn skips the PATH search."""
+    return shutil.which("git") or "git"
+
+
 def run_git(*args: str, capture: bool = True, cwd: Path | None = None) -> str | None:
     """Run a git command and return stdout, or None on failure."""
     try:
         result = subprocess.run(
-            ["git", *args],
+            [git_bin(), *args],
             capture_output=capture,
             text=True,
             cwd=cwd,
             check=True,
+            # Our fds are non-inheritable anyway, so skip closing them in the child
+            close_fds=False,
         )
         return result.stdout.strip() if capture else None
     except subprocess.CalledProcessError:
@@ -28,12 +39,19 @@ def run_git(*args: str, capture: bool = True, cwd: Path | None = None) -> str |
 
 def find_repo_root() -> Path | None:
     """Find the root of the main git repository (not worktree)."""
+    return _find_repo_root(os.getcwd())
+
+
+@functools.lru_cache(maxsize=16)
+def _find_repo_root(cwd: str) -> Path | None:
+    """Cached body of find_repo_root, keyed by working directory."""
     # Get the common git dir (shared across worktrees)
-    git_common = run_git("rev-parse", "--git-common-dir")
+    git_common = run_git("rev-parse", "--git-common-dir", cwd=Path(cwd))
     if not git_common:
         return None
 
-    git_common_path = Path(git_common).resolve()
+    # May be relative (e.g. ".git") to the directory git ran in
+    git_common_path = (Path(cwd) / git_common).resolve()
 
     # If it's a bare repo's .git or ends with .git, parent is repo root
     if git_common_path.name == ".git":
@@ -54,6 +72,14 @@ def require_repo() -> Path:
 
 def get_default_branch(repo_root: Path) -> str:
     """Detect the default branch (main/master/etc)."""
+    return _get_default_branch(str(repo_root))
+
+
+@functools.lru_cache(maxsize=16)
+def _get_default_branch(repo_root_str: str) -> str:
+    """Cached body of get_default_branch, keyed by repo root."""
+    repo_root = Path(repo_root_str)
+
     # Try to get from remote HEAD
     result = run_git("symbolic-ref", "refs/remotes/origin/HEAD", cwd=repo_root)
     if result:
@@ -67,44 +93,53 @@ def get_default_branch(repo_root: Path) -> str:
     return "main"  # fallback
 
 
+def invalidate_git_caches() -> None:
+    """Forget cached repo roots and default branches (e.g. after refs change)."""
+    _find_repo_root.cache_clear()
+    _get_default_branch.cache_clear()
+
+
 def get_current_branch() -> str | None:
     """Get the current branch name."""
     return run_git("branch", "--show-current")
 
 
 def list_branches(repo_root: Path, *, include_remote: bool = True) -> list[str]:
-    """List all branches."""
-    args = ["branch", "--format=%(refname:short)"]
+    """List all branches (local first, then remote), sorted by name."""
+    # Symbolic refs such as origin/HEAD print as empty lines and are skipped
+    args = [
+        "for-each-ref",
+        "--format=%(if)%(symref)%(then)%(else)%(refname:short)%(end)",
+        "--sort=refname",
+        "refs/heads",
+    ]
     if include_remote:
-        args.append("-a")
+        args.append("refs/remotes")
 
     result = run_git(*args, cwd=repo_root)
     if not result:
         return []
 
-    branches: list[str] = []
-    for line in result.split("\n"):
-        branch = line.strip()
-        if branch and "HEAD" not in branch:
-            branches.append(branch)
-
-    return sorted(set(branches))
+    return [branch for branch in result.splitlines() if branch]
 
 
 def fetch_origin(repo_root: Path) -> bool:
     """Fetch from origin. Returns True on success."""
     click.echo(style_info("Fetching from origin..."))
     result = subprocess.run(
-        ["git", "fetch", "--prune", "origin"],
+        [git_bin(), "fetch", "--prune", "origin"],
         check=False,
         cwd=repo_root,
         capture_output=True,
         text=True,
     )
+    # Fetching can move origin/HEAD
+    invalidate_git_caches()
     return result.returncode == 0
 
 
 def is_repo_dirty(repo_path: Path) -> bool:
     """Check if a repository has uncommitted changes."""
-    result = run_git("status", "--porcelain", cwd=repo_path)
+    # Read-only check: don't take index.lock to refresh the stat cache
+    result = run_git("--no-optional-locks", "status", "--porcelain", cwd=repo_path)
     return bool(result and result.strip())
@@ -2,19 +2,41 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+import shutil
 import subprocess
+import time
+from pathlib import Path
 from typing import Any
 
+# gh api fills these in from the current directory's repository, which saves
+# a separate `gh repo view` call when passed as GraphQL variables
+CURRENT_OWNER = "{owner}"
+CURRENT_REPO = "{repo}"
+
+# How long a viewer login cached on disk stays valid
+VIEWER_CACHE_TTL = 30 * 24 * 60 * 60
+
+
+@functools.cache
+def gh_bin() -> str:
+    """Absolute path to gh, resolved once so each spawn skips the PATH search."""
+    return shutil.which("gh") or "gh"
+
 
 def run_gh(*args: str, capture: bool = True) -> str | None:
     """Run a gh CLI command and return stdout, or None on failure."""
     try:
         result = subprocess.run(
-            ["gh", *args],
+            [gh_bin(), *args],
             capture_output=capture,
             text=True,
             check=True,
+            # Our fds are non-inheritable anyway; leaving close_fds off lets
+            # subprocess use posix_spawn for an absolute executable path
+            close_fds=False,
         )
         return result.stdout.strip() if capture else None
     except (subprocess.CalledProcessError, FileNotFoundError):
@@ -53,7 +75,64 @@ def get_repo_info() -> tuple[str, str] | None:
     return (data["owner"]["login"], data["name"])
 
 
+def _gh_hosts_file() -> Path:
+    """gh's auth config file, rewritten by gh auth login/logout/switch."""
+    config_dir = os.environ.get("GH_CONFIG_DIR")
+    if not config_dir:
+        xdg_config = os.environ.get("XDG_CONFIG_HOME")
+        config_dir = str(Path(xdg_config or Path.home() / ".config") / "gh")
+    return Path(config_dir) / "hosts.yml"
+
+
+def _viewer_cache_file() -> Path:
+    """Where get_viewer_login keeps its result between runs."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    return Path(cache_home or Path.home() / ".cache") / "workflow-tools" / "viewer.json"
+
+
+def _auth_fingerprint() -> int | None:
+    """Identify the current gh login, or None if it can't be tracked.
+
+    Tokens from the environment override hosts.yml, so those aren't cached.
+    """
+    if os.environ.get("GH_TOKEN") or os.environ.get("GITHUB_TOKEN"):
+        return None
+    try:
+        return _gh_hosts_file().stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.cache
 def get_viewer_login() -> str | None:
-    """Get the current authenticated user's login."""
+    """Get the current authenticated user's login.
+
+    Looked up once per process and cached on disk for VIEWER_CACHE_TTL. The
+    disk cache is keyed by gh's hosts.yml mtime, so switching accounts
+    invalidates it.
+    """
+    fingerprint = _auth_fingerprint()
+    cache_file = _viewer_cache_file()
+    if fingerprint is not None:
+        try:
+            cached = json.loads(cache_file.read_text())
+            if (
+                cached["auth"] == fingerprint
+                and time.time() - cached["time"] < VIEWER_CACHE_TTL
+            ):
+                return str(cached["login"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
     result = run_gh("api", "user", "--jq", ".login")
-    return result.strip() if result else None
+    login = result.strip() if result else None
+
+    if login and fingerprint is not None:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(
+                json.dumps({"login": login, "auth": fingerprint, "time": time.time()})
+            )
+        except OSError:
+            pass
+    return login
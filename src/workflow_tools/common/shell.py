@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import base64
+import functools
 import os
+import shlex
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -81,6 +84,24 @@ def _osc52_copy(text: str) -> bool:
     return True
 
 
+# Platform-specific clipboard commands, in order of preference
+CLIPBOARD_COMMANDS: tuple[tuple[str, ...], ...] = (
+    ("pbcopy",),  # macOS
+    ("xclip", "-selection", "clipboard"),  # Linux with xclip
+    ("xsel", "--clipboard", "--input"),  # Linux with xsel
+    ("clip",),  # Windows
+)
+
+
+@functools.cache
+def _available_clipboard_commands() -> tuple[tuple[str, ...], ...]:
+    """Clipboard commands that are installed, resolved once per process.
+
+    Probing PATH in-process avoids spawning commands that don't exist.
+    """
+    return tuple(cmd for cmd in CLIPBOARD_COMMANDS if shutil.which(cmd[0]))
+
+
 def copy_to_clipboard(text: str) -> bool:
     """Copy text to clipboard. Returns True on success, False if unavailable.
 
@@ -93,14 +114,7 @@ def copy_to_clipboard(text: str) -> bool:
         return _osc52_copy(text)
 
     # Try platform-specific clipboard commands for local sessions
-    clipboard_commands = [
-        ["pbcopy"],  # macOS
-        ["xclip", "-selection", "clipboard"],  # Linux with xclip
-        ["xsel", "--clipboard", "--input"],  # Linux with xsel
-        ["clip"],  # Windows
-    ]
-
-    for cmd in clipboard_commands:
+    for cmd in _available_clipboard_commands():
         try:
             subprocess.run(
                 cmd,
@@ -116,6 +130,41 @@ def copy_to_clipboard(text: str) -> bool:
     return _osc52_copy(text)
 
 
+def open_url(url: str) -> bool:
+    """Open a URL in the browser without waiting for it to start.
+
+    Commands in $BROWSER are launched in their own session and left running;
+    the webbrowser module is only used when $BROWSER is unset or unusable.
+    Returns True if a browser was launched.
+    """
+    for browser in filter(None, os.environ.get("BROWSER", "").split(os.pathsep)):
+        cmd = shlex.split(browser)
+        # Same %s placeholder convention as the webbrowser module
+        if "%s" in browser:
+            cmd = [arg.replace("%s", url) for arg in cmd]
+        else:
+            cmd.append(url)
+        try:
+            subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+            )
+            return True
+        except OSError:
+            continue
+
+    # Imported here since most commands that load this module never open a URL
+    import webbrowser
+
+    try:
+        return webbrowser.open(url)
+    except webbrowser.Error:
+        return False
+
+
 # Shell wrapper scripts
 SHELL_WRAPPER_TEMPLATE_ZSH = """
 # {tool_name} shell integration
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import functools
+import shutil
+import subprocess
 from typing import TYPE_CHECKING
 
 import click
-from InquirerPy import inquirer
 
 if TYPE_CHECKING:
     from InquirerPy.prompts.fuzzy import FuzzyPrompt
@@ -45,6 +47,15 @@ def style_dim(msg: str) -> str:
     return click.style(msg, fg=DIM)
 
 
+def _indexed_choices(options: list[str]) -> list[dict[str, object]]:
+    """Wrap options so the picker returns each option's index as its value.
+
+    This avoids a linear options.index() lookup per selection, which also
+    picked the wrong entry when two options had the same label.
+    """
+    return [{"name": option, "value": i} for i, option in enumerate(options)]
+
+
 def _bind_escape(prompt: FuzzyPrompt) -> None:
     """Bind the escape key to cancel the prompt (same as Ctrl+C)."""
 
@@ -53,41 +64,90 @@ def _bind_escape(prompt: FuzzyPrompt) -> None:
         prompt._handle_interrupt(event)  # noqa: SLF001
 
 
+@functools.cache
+def _fzf_bin() -> str | None:
+    """Path to fzf if installed, resolved once per process."""
+    return shutil.which("fzf")
+
+
+def _fzf_select(
+    fzf: str, options: list[str], message: str, *, multi: bool
+) -> list[int] | None:
+    """Pick options with fzf. Returns selected indices or None if cancelled.
+
+    Each line is prefixed with its index as a hidden tab-separated field, so
+    the selection maps back to options even when labels repeat.
+    """
+    args = [
+        fzf,
+        "--ansi",
+        "--delimiter=\t",
+        "--with-nth=2..",
+        f"--prompt={message}: ",
+        "--height=40%",
+        "--reverse",
+        "--multi" if multi else "--exact",
+    ]
+    # Picker labels are single lines, so one option per line is unambiguous
+    lines = "\n".join(f"{i}\t{option}" for i, option in enumerate(options))
+    try:
+        result = subprocess.run(
+            args, input=lines, stdout=subprocess.PIPE, text=True, check=False
+        )
+    except KeyboardInterrupt:
+        return None
+    # fzf exits 1 with no match and 130 when cancelled
+    if result.returncode != 0:
+        return None
+    return [int(line.partition("\t")[0]) for line in result.stdout.splitlines()]
+
+
 def fuzzy_select(options: list[str], message: str) -> int | None:
     """Show fuzzy select menu. Returns index or None if cancelled.
 
     Uses exact substring matching which gives predictable results -
     typing a character shows only options containing that character,
-    with matches at the start appearing first.
+    with matches at the start appearing first. Uses fzf when it is
+    installed, since it stays responsive on long lists.
     """
+    fzf = _fzf_bin()
+    if fzf:
+        selected = _fzf_select(fzf, options, message, multi=False)
+        return selected[0] if selected else None
+
+    # Imported here so non-interactive commands don't pay for prompt_toolkit
+    from InquirerPy import inquirer
+
     try:
         prompt = inquirer.fuzzy(  # type: ignore[attr-defined]
             message=message,
-            choices=options,
+            choices=_indexed_choices(options),
             match_exact=True,  # Substring match gives more predictable results
         )
         _bind_escape(prompt)
-        result = prompt.execute()
-        if result is None:
-            return None
-        return options.index(result)
+        result: int | None = prompt.execute()
+        return result
     except KeyboardInterrupt:
         return None
 
 
 def fuzzy_select_multi(options: list[str], message: str) -> list[int] | None:
     """Show fuzzy multi-select menu. Returns list of indices or None if cancelled."""
+    fzf = _fzf_bin()
+    if fzf:
+        return _fzf_select(fzf, options, message, multi=True)
+
+    from InquirerPy import inquirer
+
     try:
         prompt = inquirer.fuzzy(  # type: ignore[attr-defined]
             message=message,
-            choices=options,
+            choices=_indexed_choices(options),
             multiselect=True,
         )
         _bind_escape(prompt)
-        result = prompt.execute()
-        if result is None:
-            return None
-        return [options.index(r) for r in result]
+        result: list[int] | None = prompt.execute()
+        return result
     except KeyboardInterrupt:
         return None
 
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import re
+import string
 import tempfile
 from pathlib import Path
 
@@ -13,6 +16,43 @@ GITHUB_REPO_MAX_LENGTH = 100
 # Tmux limits
 TMUX_SESSION_NAME_MAX_LENGTH = 256
 
+# Everything validate_branch_name rejects, in one pass; the group that
+# matched selects the error message
+_BAD_BRANCH_RE = re.compile(
+    r"(?P<char>\.\.|[~^:\\ \t\n?*\[])"
+    r"|(?P<slash>\A/|/\Z)"
+    r"|(?P<dot>\A\.|\.\Z)"
+    r"|(?P<lock>\.lock\Z)"
+    r"|(?P<double_slash>//)"
+)
+_BAD_BRANCH_MESSAGES = {
+    "slash": "Branch name cannot start or end with /",
+    "dot": "Branch name cannot start or end with .",
+    "lock": "Branch name cannot end with .lock",
+    "double_slash": "Branch name cannot contain consecutive slashes",
+}
+
+# Allowed characters for worktree names and GitHub owners; both must also
+# start with an alphanumeric character
+_ALNUM = frozenset(string.ascii_letters + string.digits)
+_WORKTREE_NAME_CHARS = _ALNUM | {".", "_", "-"}
+_GITHUB_OWNER_CHARS = _ALNUM | {"-"}
+_GITHUB_REPO_RE = re.compile(r"^[a-zA-Z0-9._-]+$")
+
+# Common remote URL prefixes, handled without the regexes
+_GITHUB_URL_PREFIXES = (
+    "https://github.com/",
+    "git@github.com:",
+    "ssh://git@github.com/",
+    "http://github.com/",
+)
+
+# Match https://github.com/owner/repo or git@github.com:owner/repo
+_GITHUB_URL_RES = (
+    re.compile(r"github\.com[/:]([^/]+)/([^/.]+?)(?:\.git)?/?$"),
+    re.compile(r"github\.com[/:]([^/]+)/([^/.]+)$"),
+)
+
 
 class ValidationError(Exception):
     """Raised when input validation fails."""
@@ -41,7 +81,7 @@ def validate_worktree_name(name: str) -> str:
         )
 
     # Allow alphanumeric, hyphens, underscores, dots (but not leading dots)
-    if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*$", name):
+    if name[0] not in _ALNUM or not _WORKTREE_NAME_CHARS.issuperset(name):
         raise ValidationError(
             f"Invalid worktree name: {name!r} (use alphanumeric, hyphens, underscores)"
         )
@@ -57,23 +97,11 @@ def validate_branch_name(branch: str) -> str:
     if not branch:
         raise ValidationError("Branch name cannot be empty")
 
-    # Common dangerous patterns
-    forbidden = ["..", "~", "^", ":", "\\", " ", "\t", "\n", "?", "*", "["]
-    for char in forbidden:
-        if char in branch:
-            raise ValidationError(f"Invalid branch name: contains {char!r}")
-
-    # Must not start/end with slash or dot
-    if branch.startswith("/") or branch.endswith("/"):
-        raise ValidationError("Branch name cannot start or end with /")
-    if branch.startswith(".") or branch.endswith("."):
-        raise ValidationError("Branch name cannot start or end with .")
-    if branch.endswith(".lock"):
-        raise ValidationError("Branch name cannot end with .lock")
-
-    # No consecutive slashes
-    if "//" in branch:
-        raise ValidationError("Branch name cannot contain consecutive slashes")
+    match = _BAD_BRANCH_RE.search(branch)
+    if match:
+        if match.lastgroup == "char":
+            raise ValidationError(f"Invalid branch name: contains {match[0]!r}")
+        raise ValidationError(_BAD_BRANCH_MESSAGES[match.lastgroup or ""])
 
     return branch
 
@@ -94,6 +122,7 @@ def validate_pr_number(pr_num: int | str) -> int:
     return num
 
 
+@functools.lru_cache(maxsize=256)
 def validate_github_owner(owner: str) -> str:
     """Validate GitHub username/organization name.
 
@@ -106,7 +135,7 @@ def validate_github_owner(owner: str) -> str:
     if len(owner) > GITHUB_OWNER_MAX_LENGTH:
         raise ValidationError(f"GitHub owner too long: {owner!r}")
 
-    if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9-]*$", owner):
+    if owner[0] not in _ALNUM or not _GITHUB_OWNER_CHARS.issuperset(owner):
         raise ValidationError(f"Invalid GitHub owner: {owner!r}")
 
     # Cannot have consecutive hyphens or end with hyphen
@@ -116,6 +145,7 @@ def validate_github_owner(owner: str) -> str:
     return owner
 
 
+@functools.lru_cache(maxsize=256)
 def validate_github_repo(repo: str) -> str:
     """Validate GitHub repository name.
 
@@ -132,7 +162,7 @@ def validate_github_repo(repo: str) -> str:
     if repo in (".", ".."):
         raise ValidationError(f"Invalid repository name: {repo!r}")
 
-    if not re.match(r"^[a-zA-Z0-9._-]+$", repo):
+    if not _GITHUB_REPO_RE.match(repo):
         raise ValidationError(f"Invalid repository name: {repo!r}")
 
     return repo
@@ -152,18 +182,21 @@ def validate_path_no_traversal(path_str: str, base_dir: Path | None = None) -> P
     if ".." in path.parts:
         raise ValidationError(f"Path traversal not allowed: {path_str!r}")
 
-    resolved = path.resolve()
+    resolved = os.path.realpath(path)
 
     if base_dir is not None:
-        base_resolved = base_dir.resolve()
-        try:
-            resolved.relative_to(base_resolved)
-        except ValueError as e:
-            raise ValidationError(
-                f"Path must be within {base_dir}: {path_str!r}"
-            ) from e
+        base_resolved = os.path.realpath(base_dir)
+        # Both sides are absolute, so a shared prefix means containment
+        if os.path.commonpath((resolved, base_resolved)) != base_resolved:
+            raise ValidationError(f"Path must be within {base_dir}: {path_str!r}")
+
+    return Path(resolved)
 
-    return resolved
+
+@functools.cache
+def _resolved_temp_dir() -> Path:
+    """System temp directory with symlinks resolved (fixed for the process)."""
+    return Path(tempfile.gettempdir()).resolve()
 
 
 def validate_temp_path(path_str: str) -> Path:
@@ -176,7 +209,7 @@ def validate_temp_path(path_str: str) -> Path:
 
     path = Path(path_str)
     resolved = path.resolve()
-    temp_dir = Path(tempfile.gettempdir()).resolve()
+    temp_dir = _resolved_temp_dir()
 
     try:
         resolved.relative_to(temp_dir)
@@ -220,6 +253,7 @@ def validate_tmux_session_name(name: str) -> str:
     return name
 
 
+@functools.lru_cache(maxsize=256)
 def parse_github_url(url: str) -> tuple[str, str] | None:
     """Parse owner/repo from GitHub URL.
 
@@ -232,14 +266,21 @@ def parse_github_url(url: str) -> tuple[str, str] | None:
     if not url:
         return None
 
-    # Match https://github.com/owner/repo or git@github.com:owner/repo
-    patterns = [
-        r"github\.com[/:]([^/]+)/([^/.]+?)(?:\.git)?/?$",
-        r"github\.com[/:]([^/]+)/([^/.]+)$",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
+    # Fast path for the usual https/ssh remote forms; anything unusual falls
+    # through to the regexes below
+    for prefix in _GITHUB_URL_PREFIXES:
+        if url.startswith(prefix):
+            tail = url[len(prefix) :].removesuffix("/").removesuffix(".git")
+            owner, sep, repo = tail.partition("/")
+            if owner and sep and repo and "/" not in repo and "." not in repo:
+                try:
+                    return (validate_github_owner(owner), validate_github_repo(repo))
+                except ValidationError:
+                    return None
+            break
+
+    for pattern in _GITHUB_URL_RES:
+        match = pattern.search(url)
         if match:
             owner, repo = match.group(1), match.group(2)
             # Validate the extracted values
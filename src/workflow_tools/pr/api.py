@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import re
 import subprocess
 import sys
+import tempfile
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from typing import Any, NamedTuple
 
 import click
 
 from workflow_tools.common import style_error
-from workflow_tools.common.github import get_repo_info, gh_api_graphql, run_gh
+from workflow_tools.common.git import run_git
+from workflow_tools.common.github import (
+    get_repo_info,
+    gh_api_graphql,
+    gh_bin,
+    run_gh,
+)
 
 
 class PRInfo(NamedTuple):
@@ -72,6 +82,18 @@ class ActionResult(NamedTuple):
     message: str
 
 
+class PRSummary(NamedTuple):
+    """Open PR fields returned by gh pr list (used by pr list and the picker)."""
+
+    number: int
+    id: str  # GraphQL node ID for mutations
+    title: str
+    url: str
+    author: str
+    head_branch: str
+    is_draft: bool
+
+
 class PRListInfo(NamedTuple):
     """Minimal PR info for listing operations (used by wt pr command)."""
 
@@ -81,47 +103,56 @@ class PRListInfo(NamedTuple):
     is_draft: bool
 
 
+# Undo jq's @tsv escaping of backslash, tab, newline and carriage return
+_TSV_ESCAPE_RE = re.compile(r"\\([\\tnr])")
+_TSV_ESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+
+
 def list_prs_simple() -> list[PRListInfo]:
     """Fetch open PRs with minimal fields (for wt pr command).
 
     Returns a list of PRListInfo with just number, title, branch, and draft status.
     """
+    # Project to one tab-separated line per PR in gh rather than parsing JSON
     result = run_gh(
-        "pr", "list", "--json", "number,title,headRefName,isDraft", "--limit", "100"
+        "pr",
+        "list",
+        "--json",
+        "number,title,headRefName,isDraft",
+        "--jq",
+        ".[] | [.number, .isDraft, .headRefName, .title] | @tsv",
+        "--limit",
+        "100",
     )
     if not result:
         return []
-    try:
-        data = json.loads(result)
-        return [
+    prs = []
+    for line in result.splitlines():
+        # Skip a malformed line rather than dropping every PR over it
+        try:
+            number, is_draft, branch, title = line.split("\t")
+            pr_number = int(number)
+        except ValueError:
+            continue
+        prs.append(
             PRListInfo(
-                number=pr["number"],
-                title=pr["title"],
-                branch=pr["headRefName"],
-                is_draft=pr["isDraft"],
+                number=pr_number,
+                title=_TSV_ESCAPE_RE.sub(lambda m: _TSV_ESCAPES[m[1]], title),
+                branch=branch,
+                is_draft=is_draft == "true",
             )
-            for pr in data
-        ]
-    except (json.JSONDecodeError, KeyError):
-        return []
+        )
+    return prs
 
 
 def get_current_branch() -> str | None:
     """Get the current git branch name."""
-    try:
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        return result.stdout.strip()
-    except subprocess.CalledProcessError:
-        return None
+    return run_git("branch", "--show-current")
 
 
+@functools.cache
 def require_repo_info() -> tuple[str, str]:
-    """Get repo info or exit with error."""
+    """Get repo info or exit with error (looked up once per process)."""
     info = get_repo_info()
     if not info:
         click.echo(
@@ -144,33 +175,51 @@ def get_pr_for_branch(pr_num: int | None = None) -> PRInfo | None:
         return None
 
     try:
-        data = json.loads(result)
-        return PRInfo(
-            number=data["number"],
-            id=data["id"],
-            title=data["title"],
-            body=data.get("body"),
-            url=data["url"],
-            state=data["state"],
-            author=data["author"]["login"],
-            base_branch=data["baseRefName"],
-            head_branch=data["headRefName"],
-            is_draft=data["isDraft"],
-            mergeable=data.get("mergeable"),
-            review_decision=data.get("reviewDecision"),
-            additions=data.get("additions", 0),
-            deletions=data.get("deletions", 0),
-            changed_files=data.get("changedFiles", 0),
-        )
+        return _parse_pr_info(json.loads(result))
     except (json.JSONDecodeError, KeyError):
         return None
 
 
+def _parse_pr_info(data: dict[str, Any]) -> PRInfo:
+    """Build PRInfo from gh --json / GraphQL PullRequest fields."""
+    return PRInfo(
+        number=data["number"],
+        id=data["id"],
+        title=data["title"],
+        body=data.get("body"),
+        url=data["url"],
+        state=data["state"],
+        # GitHub returns a null author for deleted ("ghost") accounts
+        author=(data.get("author") or {}).get("login", "ghost"),
+        base_branch=data["baseRefName"],
+        head_branch=data["headRefName"],
+        is_draft=data["isDraft"],
+        mergeable=data.get("mergeable"),
+        review_decision=data.get("reviewDecision"),
+        additions=data.get("additions", 0),
+        deletions=data.get("deletions", 0),
+        changed_files=data.get("changedFiles", 0),
+    )
+
+
+_OPEN_PR_LIMIT = 1000
+
+
 def list_open_prs(
     *, author: str | None = None, include_drafts: bool = True
-) -> list[PRInfo]:
+) -> list[PRSummary]:
     """List open PRs in the repository."""
-    args = ["pr", "list", "--json", "number,title,headRefName,isDraft,id,author,url"]
+    # gh fetches pullRequests over GraphQL 100 at a time, so a limit above the
+    # page size costs nothing extra for typical repos and avoids gh's silent
+    # cutoff at 30 PRs.
+    args = [
+        "pr",
+        "list",
+        "--json",
+        "number,title,headRefName,isDraft,id,author,url",
+        "--limit",
+        str(_OPEN_PR_LIMIT),
+    ]
 
     if author:
         args.extend(["--author", author])
@@ -184,22 +233,14 @@ def list_open_prs(
     try:
         data = json.loads(result)
         return [
-            PRInfo(
+            PRSummary(
                 number=pr["number"],
                 id=pr["id"],
                 title=pr["title"],
-                body=None,
                 url=pr["url"],
-                state="OPEN",
                 author=pr["author"]["login"],
-                base_branch="",
                 head_branch=pr["headRefName"],
                 is_draft=pr["isDraft"],
-                mergeable=None,
-                review_decision=None,
-                additions=0,
-                deletions=0,
-                changed_files=0,
             )
             for pr in data
         ]
@@ -207,9 +248,28 @@ def list_open_prs(
         return []
 
 
-def get_pr_diff(pr_num: int) -> str | None:
-    """Get the diff for a PR."""
-    return run_gh("pr", "diff", str(pr_num))
+def iter_pr_diff(pr_num: int) -> Iterator[str]:
+    """Yield the diff for a PR line by line as gh produces it.
+
+    Raises CalledProcessError (with gh's stderr) once the output is drained if
+    gh failed, and FileNotFoundError if gh isn't installed.
+    """
+    cmd = [gh_bin(), "pr", "diff", str(pr_num)]
+    # stderr goes to a file so a chatty gh can't block on a full pipe
+    with tempfile.TemporaryFile("w+", errors="replace") as stderr:
+        with subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            text=True,
+            errors="replace",
+        ) as proc:
+            yield from proc.stdout or ()
+        if proc.returncode != 0:
+            stderr.seek(0)
+            raise subprocess.CalledProcessError(
+                proc.returncode, cmd, stderr=stderr.read()
+            )
 
 
 def get_pr_files(pr_num: int) -> list[str]:
@@ -219,15 +279,11 @@ def get_pr_files(pr_num: int) -> list[str]:
     )
     if not result:
         return []
-    return [f for f in result.strip().split("\n") if f]
+    return list(filter(None, result.splitlines()))
 
 
-def get_review_threads(owner: str, repo: str, pr_number: int) -> list[ReviewThread]:
-    """Get review threads with resolution status using GraphQL."""
-    query = """
-    query($owner: String!, $repo: String!, $pr: Int!) {
-      repository(owner: $owner, name: $repo) {
-        pullRequest(number: $pr) {
+# GraphQL selection for a PullRequest's review threads
+_REVIEW_THREADS_SELECTION = """
           reviewThreads(first: 100) {
             nodes {
               id
@@ -249,9 +305,19 @@ def get_review_threads(owner: str, repo: str, pr_number: int) -> list[ReviewThre
               }
             }
           }
-        }
-      }
-    }
+"""
+
+
+def get_review_threads(owner: str, repo: str, pr_number: int) -> list[ReviewThread]:
+    """Get review threads with resolution status using GraphQL."""
+    query = f"""
+    query($owner: String!, $repo: String!, $pr: Int!) {{
+      repository(owner: $owner, name: $repo) {{
+        pullRequest(number: $pr) {{
+          {_REVIEW_THREADS_SELECTION}
+        }}
+      }}
+    }}
     """
     result = gh_api_graphql(query, {"owner": owner, "repo": repo, "pr": pr_number})
     if not result:
@@ -265,9 +331,22 @@ def get_review_threads(owner: str, repo: str, pr_number: int) -> list[ReviewThre
             .get("reviewThreads", {})
             .get("nodes", [])
         )
-        threads = []
-        for t in threads_data:
-            comments = [
+        return _parse_review_threads(threads_data)
+    except (KeyError, TypeError):
+        return []
+
+
+def _parse_review_threads(threads_data: list[dict[str, Any]]) -> list[ReviewThread]:
+    """Build ReviewThreads from GraphQL reviewThreads nodes."""
+    return [
+        ReviewThread(
+            id=t["id"],
+            path=t.get("path", "unknown"),
+            line=t.get("line"),
+            start_line=t.get("startLine"),
+            is_resolved=t.get("isResolved", False),
+            is_outdated=t.get("isOutdated", False),
+            comments=[
                 ThreadComment(
                     id=c["id"],
                     author=c.get("author", {}).get("login", "unknown"),
@@ -276,21 +355,10 @@ def get_review_threads(owner: str, repo: str, pr_number: int) -> list[ReviewThre
                     diff_hunk=c.get("diffHunk"),
                 )
                 for c in t.get("comments", {}).get("nodes", [])
-            ]
-            threads.append(
-                ReviewThread(
-                    id=t["id"],
-                    path=t.get("path", "unknown"),
-                    line=t.get("line"),
-                    start_line=t.get("startLine"),
-                    is_resolved=t.get("isResolved", False),
-                    is_outdated=t.get("isOutdated", False),
-                    comments=comments,
-                )
-            )
-        return threads
-    except (KeyError, TypeError):
-        return []
+            ],
+        )
+        for t in threads_data
+    ]
 
 
 def get_pr_comments(owner: str, repo: str, pr_number: int) -> list[DiscussionComment]:
@@ -314,8 +382,82 @@ def get_pr_comments(owner: str, repo: str, pr_number: int) -> list[DiscussionCom
         return []
 
 
+def get_pr_full_context(
+    owner: str, repo: str, pr_number: int
+) -> tuple[PRInfo, list[ReviewThread], list[DiscussionComment]] | None:
+    """Get PR info, review threads and discussion comments in one GraphQL query.
+
+    Equivalent to get_pr_for_branch + get_review_threads + get_pr_comments
+    with a single gh call. Returns None if the PR can't be fetched.
+    """
+    query = f"""
+    query($owner: String!, $repo: String!, $pr: Int!) {{
+      repository(owner: $owner, name: $repo) {{
+        pullRequest(number: $pr) {{
+          number
+          id
+          title
+          body
+          url
+          state
+          author {{ login }}
+          baseRefName
+          headRefName
+          isDraft
+          mergeable
+          reviewDecision
+          additions
+          deletions
+          changedFiles
+          comments(first: 100) {{
+            nodes {{
+              id
+              author {{ login }}
+              body
+              createdAt
+            }}
+          }}
+          {_REVIEW_THREADS_SELECTION}
+        }}
+      }}
+    }}
+    """
+    result = gh_api_graphql(query, {"owner": owner, "repo": repo, "pr": pr_number})
+    if not result:
+        return None
+
+    try:
+        data = result["data"]["repository"]["pullRequest"]
+        if not data:
+            return None
+        comments = [
+            DiscussionComment(
+                id=c["id"],
+                author=(c.get("author") or {}).get("login", "unknown"),
+                body=c.get("body", ""),
+                created_at=c.get("createdAt", ""),
+            )
+            for c in data.get("comments", {}).get("nodes", [])
+        ]
+        threads = _parse_review_threads(data.get("reviewThreads", {}).get("nodes", []))
+        return (_parse_pr_info(data), threads, comments)
+    except (KeyError, TypeError):
+        return None
+
+
+_GITHUB_TIMESTAMP_LENGTH = len("2024-01-15T10:30:00Z")
+
+
 def format_date(iso_date: str) -> str:
     """Format ISO date to readable format."""
+    # GitHub timestamps are always YYYY-MM-DDTHH:MM:SSZ; slice those directly
+    if (
+        len(iso_date) == _GITHUB_TIMESTAMP_LENGTH
+        and iso_date[-1] == "Z"
+        and iso_date[4] == iso_date[7] == "-"
+        and iso_date[10] == "T"
+    ):
+        return f"{iso_date[:10]} {iso_date[11:16]}"
     try:
         dt = datetime.fromisoformat(iso_date)
         return dt.strftime("%Y-%m-%d %H:%M")
@@ -364,6 +506,55 @@ def unresolve_thread(thread_id: str) -> ActionResult:
     return ActionResult(True, f"Unresolved thread {thread_id}")
 
 
+def _batch_thread_mutation(
+    mutation: str,
+    verb: str,
+    thread_ids: list[str],
+    single: Callable[[str], ActionResult],
+) -> list[ActionResult]:
+    """Run one aliased mutation per thread in a single GraphQL request."""
+    if len(thread_ids) <= 1:
+        return [single(tid) for tid in thread_ids]
+
+    params = ", ".join(f"$t{i}: ID!" for i in range(len(thread_ids)))
+    fields = "\n".join(
+        f"t{i}: {mutation}(input: {{threadId: $t{i}}}) {{ thread {{ isResolved }} }}"
+        for i in range(len(thread_ids))
+    )
+    query = f"mutation({params}) {{\n{fields}\n}}"
+    variables = {f"t{i}": tid for i, tid in enumerate(thread_ids)}
+
+    result = gh_api_graphql(query, variables)
+    data = result.get("data") if result else None
+    if not data:
+        # gh fails the whole request if any mutation errors; retry one by one
+        # so each thread reports its own outcome
+        return [single(tid) for tid in thread_ids]
+
+    return [
+        (
+            ActionResult(True, f"{verb.capitalize()}d thread {tid}")
+            if data.get(f"t{i}")
+            else ActionResult(False, f"Failed to {verb} thread {tid}")
+        )
+        for i, tid in enumerate(thread_ids)
+    ]
+
+
+def resolve_threads(thread_ids: list[str]) -> list[ActionResult]:
+    """Resolve several review threads with one GraphQL request."""
+    return _batch_thread_mutation(
+        "resolveReviewThread", "resolve", thread_ids, resolve_thread
+    )
+
+
+def unresolve_threads(thread_ids: list[str]) -> list[ActionResult]:
+    """Unresolve several review threads with one GraphQL request."""
+    return _batch_thread_mutation(
+        "unresolveReviewThread", "unresolve", thread_ids, unresolve_thread
+    )
+
+
 def get_pending_review(
     pr_id: str, viewer_login: str | None = None
 ) -> dict[str, Any] | None:
@@ -420,10 +611,9 @@ def submit_pending_review(pr_id: str, review_id: str | None = None) -> ActionRes
     return ActionResult(True, "Review submitted")
 
 
-def reply_to_thread(thread_id: str, message: str, pr_id: str) -> ActionResult:
-    """Reply to a review thread using GraphQL."""
-    # Get the first comment ID from the thread to reply to
-    get_thread_query = """
+def _get_first_comment_id(thread_id: str) -> str | None:
+    """Get the ID of the first comment in a review thread."""
+    query = """
     query($threadId: ID!) {
       node(id: $threadId) {
         ... on PullRequestReviewThread {
@@ -434,23 +624,45 @@ def reply_to_thread(thread_id: str, message: str, pr_id: str) -> ActionResult:
       }
     }
     """
-    result = gh_api_graphql(get_thread_query, {"threadId": thread_id})
+    result = gh_api_graphql(query, {"threadId": thread_id})
     if not result:
-        return ActionResult(False, f"Failed to get thread info: {thread_id}")
+        return None
 
     comments = (
         result.get("data", {}).get("node", {}).get("comments", {}).get("nodes", [])
     )
     if not comments:
-        return ActionResult(False, f"No comments found in thread {thread_id}")
+        return None
+    return str(comments[0]["id"])
+
+
+def reply_to_thread(
+    thread_id: str, message: str, pr_id: str, *, comment_id: str | None = None
+) -> tuple[ActionResult, str | None]:
+    """Reply to a review thread using GraphQL.
+
+    Pass the thread's first comment ID as comment_id when it is already known
+    (e.g. from get_review_threads) to skip looking it up.
 
-    comment_id = comments[0]["id"]
+    Returns the result and, when the reply landed in a pending review that
+    still needs submitting, that review's ID.
+    """
+    if comment_id is None:
+        comment_id = _get_first_comment_id(thread_id)
+        if comment_id is None:
+            return (
+                ActionResult(False, f"No comments found in thread {thread_id}"),
+                None,
+            )
 
-    # Now reply to that comment
+    # Reply to the thread's first comment
     reply_query = """
     mutation($prId: ID!, $commentId: ID!, $body: String!) {
       addPullRequestReviewComment(input: {pullRequestId: $prId, inReplyTo: $commentId, body: $body}) {
-        comment { id }
+        comment {
+          id
+          pullRequestReview { id state }
+        }
       }
     }
     """
@@ -458,8 +670,15 @@ def reply_to_thread(thread_id: str, message: str, pr_id: str) -> ActionResult:
         reply_query, {"prId": pr_id, "commentId": comment_id, "body": message}
     )
     if not result or result.get("errors"):
-        return ActionResult(False, f"Failed to reply to thread {thread_id}")
-    return ActionResult(True, f"Replied to thread {thread_id}")
+        return ActionResult(False, f"Failed to reply to thread {thread_id}"), None
+
+    review = (
+        (result.get("data", {}).get("addPullRequestReviewComment") or {})
+        .get("comment", {})
+        .get("pullRequestReview")
+    ) or {}
+    pending_review_id = review.get("id") if review.get("state") == "PENDING" else None
+    return ActionResult(True, f"Replied to thread {thread_id}"), pending_review_id
 
 
 def approve_pr(pr_num: int, message: str | None = None) -> ActionResult:
@@ -503,9 +722,3 @@ def close_pr(pr_num: int) -> ActionResult:
     if result is None:
         return ActionResult(False, "Failed to close PR")
     return ActionResult(True, "PR closed")
-
-
-def get_viewer_login() -> str | None:
-    """Get the current authenticated user's login."""
-    result = run_gh("api", "user", "--jq", ".login")
-    return result.strip() if result else None
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import json
+import subprocess
 import sys
-import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 
 import click
 
@@ -23,26 +24,26 @@ from workflow_tools.common import (
     style_info,
     style_success,
     style_warn,
-    validate_pr_number,
     validate_worktree_name,
 )
-from workflow_tools.common.shell import output_cd
+from workflow_tools.common.github import CURRENT_OWNER, CURRENT_REPO, get_viewer_login
+from workflow_tools.common.shell import open_url, output_cd
 from workflow_tools.common.ui import fuzzy_select_multi
 from workflow_tools.pr.api import (
     ActionResult,
+    DiscussionComment,
     PRInfo,
+    PRSummary,
     ReviewThread,
     approve_pr,
     close_pr,
     format_date,
     get_current_branch,
-    get_pending_review,
-    get_pr_comments,
-    get_pr_diff,
     get_pr_files,
     get_pr_for_branch,
+    get_pr_full_context,
     get_review_threads,
-    get_viewer_login,
+    iter_pr_diff,
     list_open_prs,
     mark_draft,
     mark_ready,
@@ -51,20 +52,72 @@ from workflow_tools.pr.api import (
     request_changes,
     require_repo_info,
     resolve_thread,
+    resolve_threads,
     submit_pending_review,
-    unresolve_thread,
+    unresolve_threads,
 )
-from workflow_tools.wt.cli import create_worktree, get_worktree_path
 
 # Preview truncation lengths
 PREVIEW_SHORT = 40
 PREVIEW_LONG = 50
 DIFF_CONTEXT_LINES = 5
 
+# Interactive mode menu; the threads entry is inserted second with its count
+_MENU_ACTIONS = (
+    "[i] View full info",
+    "[f] View files",
+    "[d] View diff",
+    "[o] Open in browser",
+    "[w] Create worktree",
+    "[r] Resolve threads",
+    "[y] Reply to thread",
+    "[c] Post comment",
+    "[a] Approve",
+    "[x] Request changes",
+    "[s] Toggle draft/ready",
+    "[q] Quit",
+)
+_THREADS_ACTION = "[t] View threads ({} unresolved)"
+
+# Flatten previews to one line; GitHub bodies often use \r\n line endings
+_PREVIEW_TRANS = str.maketrans("\n\r\t", "   ")
+
+# Styled fragments for list output, built once rather than per row.
+# Templates take their value via str.format, which never re-parses arguments.
+_RESOLVED_TAG = click.style("[resolved]", fg=GREEN)
+_UNRESOLVED_TAG = click.style("[unresolved]", fg=YELLOW)
+_DRAFT_TAG = click.style(" [draft]", fg=YELLOW)
+_DIM_TEMPLATE = click.style("{}", fg=DIM)
+_PR_NUM_TEMPLATE = click.style("#{}", fg=CYAN, bold=True)
+_AUTHOR_TEMPLATE = click.style("@{}", fg=DIM)
+
+# pr list --json emits every PRInfo field. gh pr list only supplies the
+# PRSummary ones, so the rest keep these placeholder values.
+_LIST_JSON_DEFAULTS: dict[str, object] = {
+    "body": None,
+    "state": "OPEN",
+    "base_branch": "",
+    "mergeable": None,
+    "review_decision": None,
+    "additions": 0,
+    "deletions": 0,
+    "changed_files": 0,
+}
+
+
+def get_pr_or_exit(
+    pr_num: int | None,
+    ctx_pr_num: int | None = None,
+    ctx_pr_info: PRInfo | None = None,
+) -> PRInfo:
+    """Get PR info or exit with error.
 
-def get_pr_or_exit(pr_num: int | None, ctx_pr_num: int | None = None) -> PRInfo:
-    """Get PR info or exit with error."""
+    ctx_pr_info is the PR interactive_mode already looked up; it is returned
+    as-is when it matches the requested number.
+    """
     num = pr_num or ctx_pr_num
+    if ctx_pr_info is not None and num == ctx_pr_info.number:
+        return ctx_pr_info
     pr = get_pr_for_branch(num)
     if not pr:
         if num:
@@ -79,7 +132,50 @@ def get_pr_or_exit(pr_num: int | None, ctx_pr_num: int | None = None) -> PRInfo:
     return pr
 
 
-def format_pr_option(pr: PRInfo) -> str:
+def get_pr_and_repo_or_exit(
+    pr_num: int | None,
+    ctx_pr_num: int | None = None,
+    ctx_pr_info: PRInfo | None = None,
+) -> tuple[PRInfo, tuple[str, str]]:
+    """Get PR info and (owner, repo), running the two gh calls concurrently.
+
+    For the session's own PR the repo was already resolved when it was looked
+    up, so gh api's {owner}/{repo} placeholders stand in for `gh repo view`.
+    """
+    if ctx_pr_info is not None and (pr_num or ctx_pr_num) == ctx_pr_info.number:
+        return ctx_pr_info, (CURRENT_OWNER, CURRENT_REPO)
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        pr_future = pool.submit(get_pr_or_exit, pr_num, ctx_pr_num)
+        repo_future = pool.submit(require_repo_info)
+        return pr_future.result(), repo_future.result()
+
+
+def get_pr_context_or_exit(
+    pr_num: int,
+) -> tuple[PRInfo, list[ReviewThread], list[DiscussionComment]]:
+    """Get PR info, review threads and comments for the current repo, or exit."""
+    context = get_pr_full_context(CURRENT_OWNER, CURRENT_REPO, pr_num)
+    if context is None:
+        click.echo(style_error(f"PR #{pr_num} not found"), err=True)
+        sys.exit(1)
+    return context
+
+
+def get_session_threads(
+    ctx: click.Context, owner: str, repo: str, pr_num: int
+) -> list[ReviewThread]:
+    """Get review threads, reusing the interactive session's copy if present.
+
+    interactive_mode stores the threads it fetched under ctx.obj["threads"]
+    as (pr_num, threads); commands that change threads drop that entry.
+    """
+    cached = ctx.obj.get("threads")
+    if cached is not None and cached[0] == pr_num:
+        return list(cached[1])
+    return get_review_threads(owner, repo, pr_num)
+
+
+def format_pr_option(pr: PRSummary) -> str:
     """Format a PR for display in picker."""
     draft = " [draft]" if pr.is_draft else ""
     return f"#{pr.number}{draft} {pr.head_branch} - {pr.title}"
@@ -97,15 +193,21 @@ def print_action_results(results: list[ActionResult]) -> bool:
     return not any_failed
 
 
+def thread_preview(thread: ReviewThread, length: int) -> str:
+    """First comment of a thread on one line, truncated to length."""
+    if not thread.comments:
+        return ""
+    body = thread.comments[0].body
+    if len(body) <= length:
+        return body.translate(_PREVIEW_TRANS)
+    return body[:length].translate(_PREVIEW_TRANS) + "..."
+
+
 def format_thread_option(thread: ReviewThread) -> str:
     """Format a thread for display in picker."""
     status = "[resolved]" if thread.is_resolved else "[unresolved]"
     line = thread.line or thread.start_line or "?"
-    preview = ""
-    if thread.comments:
-        preview = thread.comments[0].body[:PREVIEW_LONG].replace("\n", " ")
-        if len(thread.comments[0].body) > PREVIEW_LONG:
-            preview += "..."
+    preview = thread_preview(thread, PREVIEW_LONG)
     return f"{thread.path}:{line} {status} - {preview}"
 
 
@@ -177,9 +279,10 @@ def interactive_mode(ctx: click.Context) -> None:
 
         pr_num = prs[index].number
 
-    # Get full PR info
-    pr = get_pr_or_exit(pr_num)
-    owner, repo = require_repo_info()
+    # Get full PR info and its review threads in one request
+    pr, threads, _ = get_pr_context_or_exit(pr_num)
+    ctx.obj["pr_info"] = pr
+    ctx.obj["threads"] = (pr.number, threads)
 
     # Show PR summary
     draft = click.style(" [DRAFT]", fg=YELLOW) if pr.is_draft else ""
@@ -197,28 +300,18 @@ def interactive_mode(ctx: click.Context) -> None:
     )
     click.echo()
 
-    # Get thread count
-    threads = get_review_threads(owner, repo, pr.number)
-    unresolved = [t for t in threads if not t.is_resolved]
-
-    # Actions menu
-    actions = [
-        "[i] View full info",
-        f"[t] View threads ({len(unresolved)} unresolved)",
-        "[f] View files",
-        "[d] View diff",
-        "[o] Open in browser",
-        "[w] Create worktree",
-        "[r] Resolve threads",
-        "[y] Reply to thread",
-        "[c] Post comment",
-        "[a] Approve",
-        "[x] Request changes",
-        "[s] Toggle draft/ready",
-        "[q] Quit",
-    ]
-
     while True:
+        # Actions that change threads drop the session copy, so this refetches
+        # after them and keeps the unresolved count current
+        threads = get_session_threads(ctx, CURRENT_OWNER, CURRENT_REPO, pr.number)
+        ctx.obj["threads"] = (pr.number, threads)
+        unresolved = sum(not t.is_resolved for t in threads)
+        actions = [
+            _MENU_ACTIONS[0],
+            _THREADS_ACTION.format(unresolved),
+            *_MENU_ACTIONS[1:],
+        ]
+
         click.echo()
         index = fuzzy_select(actions, "Action")
         if index is None or index == len(actions) - 1:  # Quit
@@ -263,6 +356,7 @@ def interactive_mode(ctx: click.Context) -> None:
                 ctx.invoke(draft_cmd, pr_num=pr.number)
             # Refresh PR info
             pr = get_pr_or_exit(pr.number)
+            ctx.obj["pr_info"] = pr
 
 
 @cli.command()
@@ -291,11 +385,12 @@ def info(
         pr info -r        # Include resolved threads
         pr info -f        # Show full diff context
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
-    owner, repo = require_repo_info()
+    num = pr_num or ctx.obj.get("pr_num")
+    if not num:
+        # Look up the current branch's PR number first
+        num = get_pr_or_exit(None).number
 
-    threads = get_review_threads(owner, repo, pr.number)
-    pr_comments = get_pr_comments(owner, repo, pr.number)
+    pr, threads, pr_comments = get_pr_context_or_exit(num)
 
     if as_json:
         output = {
@@ -407,7 +502,7 @@ def files(ctx: click.Context, pr_num: int | None) -> None:
         pr files 123          # Specific PR
         pr files | xargs cat  # View all changed files
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
+    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"), ctx.obj.get("pr_info"))
     file_list = get_pr_files(pr.number)
     for f in file_list:
         click.echo(f)
@@ -423,10 +518,19 @@ def diff(ctx: click.Context, pr_num: int | None) -> None:
         pr diff          # Current branch's PR diff
         pr diff 123      # Specific PR diff
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
-    diff_content = get_pr_diff(pr.number)
-    if diff_content:
-        click.echo(diff_content)
+    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"), ctx.obj.get("pr_info"))
+    # Stream so large diffs start printing before gh finishes
+    try:
+        for line in iter_pr_diff(pr.number):
+            click.echo(line, nl=False)
+    except subprocess.CalledProcessError as e:
+        click.echo(style_error(f"Failed to get diff for PR #{pr.number}"), err=True)
+        if e.stderr.strip():
+            click.echo(e.stderr.rstrip(), err=True)
+        sys.exit(1)
+    except FileNotFoundError:
+        click.echo(style_error("gh CLI not available"), err=True)
+        sys.exit(1)
 
 
 @cli.command("threads")
@@ -450,10 +554,11 @@ def threads_cmd(
     OUTPUT FORMAT:
         PRRT_abc123  src/main.py:42  [unresolved]  "Consider using..."
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
-    owner, repo = require_repo_info()
+    pr, (owner, repo) = get_pr_and_repo_or_exit(
+        pr_num, ctx.obj.get("pr_num"), ctx.obj.get("pr_info")
+    )
 
-    thread_list = get_review_threads(owner, repo, pr.number)
+    thread_list = get_session_threads(ctx, owner, repo, pr.number)
 
     if not resolved:
         thread_list = [t for t in thread_list if not t.is_resolved]
@@ -469,18 +574,10 @@ def threads_cmd(
         return
 
     for t in thread_list:
-        status = (
-            click.style("[resolved]", fg=GREEN)
-            if t.is_resolved
-            else click.style("[unresolved]", fg=YELLOW)
-        )
+        status = _RESOLVED_TAG if t.is_resolved else _UNRESOLVED_TAG
         line = t.line or t.start_line or "?"
-        preview = ""
-        if t.comments:
-            preview = t.comments[0].body[:PREVIEW_SHORT].replace("\n", " ")
-            if len(t.comments[0].body) > PREVIEW_SHORT:
-                preview += "..."
-        thread_id = click.style(t.id, fg=DIM)
+        preview = thread_preview(t, PREVIEW_SHORT)
+        thread_id = _DIM_TEMPLATE.format(t.id)
         click.echo(f'  {thread_id}  {t.path}:{line}  {status}  "{preview}"')
 
 
@@ -505,7 +602,9 @@ def list_cmd(author: str | None, *, mine: bool, draft: bool, as_json: bool) -> N
     prs = list_open_prs(author=author, include_drafts=draft)
 
     if as_json:
-        click.echo(json.dumps([p._asdict() for p in prs], indent=2, default=str))
+        rows = [{**_LIST_JSON_DEFAULTS, **p._asdict()} for p in prs]
+        data = [{field: row[field] for field in PRInfo._fields} for row in rows]
+        click.echo(json.dumps(data, indent=2, default=str))
         return
 
     if not prs:
@@ -513,9 +612,9 @@ def list_cmd(author: str | None, *, mine: bool, draft: bool, as_json: bool) -> N
         return
 
     for pr in prs:
-        num = click.style(f"#{pr.number}", fg=CYAN, bold=True)
-        draft_marker = click.style(" [draft]", fg=YELLOW) if pr.is_draft else ""
-        author_styled = click.style(f"@{pr.author}", fg=DIM)
+        num = _PR_NUM_TEMPLATE.format(pr.number)
+        draft_marker = _DRAFT_TAG if pr.is_draft else ""
+        author_styled = _AUTHOR_TEMPLATE.format(pr.author)
         click.echo(
             f"  {num}{draft_marker} {pr.head_branch} - {pr.title} {author_styled}"
         )
@@ -544,36 +643,36 @@ def resolve(
         pr resolve PRRT_abc PRRT_def        # Resolve multiple
         pr resolve --all                    # Resolve all threads
     """
-    pr = get_pr_or_exit(None, ctx.obj.get("pr_num"))
-    owner, repo = require_repo_info()
+    pr, (owner, repo) = get_pr_and_repo_or_exit(
+        None, ctx.obj.get("pr_num"), ctx.obj.get("pr_info")
+    )
 
-    if not thread_ids and not resolve_all:
-        # Interactive mode
-        all_threads = get_review_threads(owner, repo, pr.number)
+    if resolve_all or not thread_ids:
+        all_threads = get_session_threads(ctx, owner, repo, pr.number)
         unresolved = [t for t in all_threads if not t.is_resolved]
 
-        if not unresolved:
-            click.echo(style_info("No unresolved threads"))
-            return
-
-        options = [format_thread_option(t) for t in unresolved]
-        indices = fuzzy_select_multi(options, "Select threads to resolve")
-        if not indices:
-            click.echo(style_dim("Cancelled."))
-            return
+        if resolve_all:
+            thread_ids = tuple(t.id for t in unresolved)
+        else:
+            # Interactive mode
+            if not unresolved:
+                click.echo(style_info("No unresolved threads"))
+                return
 
-        thread_ids = tuple(unresolved[i].id for i in indices)
+            options = [format_thread_option(t) for t in unresolved]
+            indices = fuzzy_select_multi(options, "Select threads to resolve")
+            if not indices:
+                click.echo(style_dim("Cancelled."))
+                return
 
-    if resolve_all:
-        all_threads = get_review_threads(owner, repo, pr.number)
-        unresolved = [t for t in all_threads if not t.is_resolved]
-        thread_ids = tuple(t.id for t in unresolved)
+            thread_ids = tuple(unresolved[i].id for i in indices)
 
     if not thread_ids:
         click.echo(style_dim("No threads to resolve"))
         return
 
-    results = [resolve_thread(tid) for tid in thread_ids]
+    results = resolve_threads(list(thread_ids))
+    ctx.obj.pop("threads", None)
     print_action_results(results)
 
 
@@ -590,12 +689,13 @@ def unresolve(ctx: click.Context, thread_ids: tuple[str, ...]) -> None:
         pr unresolve PRRT_abc123        # Unresolve one thread
         pr unresolve PRRT_abc PRRT_def  # Unresolve multiple
     """
-    pr = get_pr_or_exit(None, ctx.obj.get("pr_num"))
-    owner, repo = require_repo_info()
+    pr, (owner, repo) = get_pr_and_repo_or_exit(
+        None, ctx.obj.get("pr_num"), ctx.obj.get("pr_info")
+    )
 
     if not thread_ids:
         # Interactive mode
-        all_threads = get_review_threads(owner, repo, pr.number)
+        all_threads = get_session_threads(ctx, owner, repo, pr.number)
         resolved_threads = [t for t in all_threads if t.is_resolved]
 
         if not resolved_threads:
@@ -610,7 +710,8 @@ def unresolve(ctx: click.Context, thread_ids: tuple[str, ...]) -> None:
 
         thread_ids = tuple(resolved_threads[i].id for i in indices)
 
-    results = [unresolve_thread(tid) for tid in thread_ids]
+    results = unresolve_threads(list(thread_ids))
+    ctx.obj.pop("threads", None)
     print_action_results(results)
 
 
@@ -641,12 +742,14 @@ def reply(
         pr reply PRRT_abc "Done"              # Reply with message
         pr reply PRRT_abc "Fixed" --resolve   # Reply and resolve
     """
-    pr = get_pr_or_exit(None, ctx.obj.get("pr_num"))
-    owner, repo = require_repo_info()
+    pr, (owner, repo) = get_pr_and_repo_or_exit(
+        None, ctx.obj.get("pr_num"), ctx.obj.get("pr_info")
+    )
+    first_comment_id = None
 
     if not thread_id:
         # Interactive mode
-        all_threads = get_review_threads(owner, repo, pr.number)
+        all_threads = get_session_threads(ctx, owner, repo, pr.number)
         # Show unresolved first
         all_threads.sort(key=lambda t: t.is_resolved)
 
@@ -664,6 +767,8 @@ def reply(
 
         # Show thread context
         thread = all_threads[index]
+        if thread.comments:
+            first_comment_id = thread.comments[0].id
         click.echo()
         click.echo(f"--- Thread: {thread.path}:{thread.line or '?'} ---")
         for comment in thread.comments:
@@ -674,22 +779,30 @@ def reply(
     if not message:
         message = click.prompt("Reply")
 
-    # Check for pending review
-    viewer = get_viewer_login()
-    pending_review = get_pending_review(pr.id, viewer)
-
-    result = reply_to_thread(thread_id, message, pr.id)
+    result, pending_review_id = reply_to_thread(
+        thread_id, message, pr.id, comment_id=first_comment_id
+    )
+    ctx.obj.pop("threads", None)
     results = [result]
 
     if result.success:
-        # Submit the reply
-        submit_result = submit_pending_review(pr.id)
-        if not submit_result.success and pending_review is None:
-            results.append(submit_result)
-
-    if do_resolve and result.success:
-        resolve_result = resolve_thread(thread_id)
-        results.append(resolve_result)
+        # Submitting the reply and resolving the thread are independent
+        # mutations, so send them together
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            submit_future = (
+                pool.submit(submit_pending_review, pr.id, pending_review_id)
+                if pending_review_id
+                else None
+            )
+            resolve_future = (
+                pool.submit(resolve_thread, thread_id) if do_resolve else None
+            )
+            if submit_future is not None:
+                submit_result = submit_future.result()
+                if not submit_result.success:
+                    results.append(submit_result)
+            if resolve_future is not None:
+                results.append(resolve_future.result())
 
     print_action_results(results)
 
@@ -708,7 +821,7 @@ def comment(ctx: click.Context, message: str | None, pr_num: int | None) -> None
         pr comment "Fixed" 123    # Comment on PR #123
         pr c "LGTM"               # Short alias
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
+    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"), ctx.obj.get("pr_info"))
 
     if not message:
         message = click.prompt("Comment")
@@ -729,7 +842,7 @@ def approve(ctx: click.Context, pr_num: int | None, message: str | None) -> None
         pr approve 123          # Approve PR #123
         pr approve -m "LGTM!"   # With message
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
+    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"), ctx.obj.get("pr_info"))
     result = approve_pr(pr.number, message)
     print_action_results([result])
 
@@ -745,7 +858,7 @@ def request_changes_cmd(ctx: click.Context, message: str, pr_num: int | None) ->
         pr request-changes "Please add tests"
         pr rc "Add error handling" 123
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
+    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"), ctx.obj.get("pr_info"))
     result = request_changes(pr.number, message)
     print_action_results([result])
 
@@ -760,7 +873,7 @@ def ready_cmd(ctx: click.Context, pr_num: int | None) -> None:
         pr ready        # Current branch's PR
         pr ready 123    # Specific PR
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
+    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"), ctx.obj.get("pr_info"))
     result = mark_ready(pr.number)
     print_action_results([result])
 
@@ -775,7 +888,7 @@ def draft_cmd(ctx: click.Context, pr_num: int | None) -> None:
         pr draft        # Current branch's PR
         pr draft 123    # Specific PR
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
+    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"), ctx.obj.get("pr_info"))
     result = mark_draft(pr.number)
     print_action_results([result])
 
@@ -786,8 +899,8 @@ def draft_cmd(ctx: click.Context, pr_num: int | None) -> None:
 def open_cmd(ctx: click.Context, pr_num: int | None) -> None:
     """Open the PR in the default web browser.
 
-    Uses Python's webbrowser module which respects the $BROWSER environment
-    variable. Works automatically in VS Code Remote SSH sessions.
+    Launches $BROWSER without waiting for it (falling back to Python's
+    webbrowser module). Works automatically in VS Code Remote SSH sessions.
     Falls back to copying the URL to clipboard if browser can't be opened.
 
     EXAMPLES:
@@ -795,16 +908,13 @@ def open_cmd(ctx: click.Context, pr_num: int | None) -> None:
         pr open 123      # Open PR #123
         pr o             # Short alias
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
+    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"), ctx.obj.get("pr_info"))
     click.echo(style_info(f"Opening PR #{pr.number} in browser..."))
     click.echo(f"  {pr.url}")
 
-    try:
-        webbrowser.open(pr.url)
-    except Exception:
-        # Browser opening failed, copy to clipboard as fallback
-        if copy_to_clipboard(pr.url):
-            click.echo(style_dim("  (copied to clipboard)"))
+    # Browser opening failed, copy to clipboard as fallback
+    if not open_url(pr.url) and copy_to_clipboard(pr.url):
+        click.echo(style_dim("  (copied to clipboard)"))
 
 
 @cli.command("checkout")
@@ -823,15 +933,11 @@ def checkout_cmd(ctx: click.Context, pr_num: int | None, name: str | None) -> No
         pr checkout 123      # Create worktree for PR #123
         pr co 123 review     # Create worktree named 'review' for PR #123
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
-    repo_root = require_repo()
+    # Only this command needs the wt CLI, so keep it off other commands' startup
+    from workflow_tools.wt.cli import create_worktree, get_worktree_path
 
-    # Validate PR number
-    try:
-        validated_pr_num = validate_pr_number(pr.number)
-    except ValidationError as e:
-        click.echo(style_error(str(e)), err=True)
-        sys.exit(1)
+    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"), ctx.obj.get("pr_info"))
+    repo_root = require_repo()
 
     # Use branch name as default worktree name
     if not name:
@@ -864,15 +970,15 @@ def checkout_cmd(ctx: click.Context, pr_num: int | None, name: str | None) -> No
         return
 
     # Fetch the PR branch
-    click.echo(style_info(f"Fetching PR #{validated_pr_num}..."))
+    click.echo(style_info(f"Fetching PR #{pr.number}..."))
     fetch_result = run_git(
         "fetch",
         "origin",
-        f"pull/{validated_pr_num}/head:{pr.head_branch}",
+        f"pull/{pr.number}/head:{pr.head_branch}",
         cwd=repo_root,
     )
     if fetch_result is None:
-        click.echo(style_error(f"Failed to fetch PR #{validated_pr_num}"), err=True)
+        click.echo(style_error(f"Failed to fetch PR #{pr.number}"), err=True)
         sys.exit(1)
 
     # Create the worktree
@@ -894,7 +1000,7 @@ def close(ctx: click.Context, pr_num: int | None, *, force: bool) -> None:
         pr close           # Close with confirmation
         pr close -f 123    # Force close PR #123
     """
-    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"))
+    pr = get_pr_or_exit(pr_num, ctx.obj.get("pr_num"), ctx.obj.get("pr_info"))
 
     if not force:
         if not click.confirm(style_warn(f"Close PR #{pr.number}?"), default=False):
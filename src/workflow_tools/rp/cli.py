@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 import subprocess
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import click
@@ -17,6 +20,7 @@ from workflow_tools.common import (
     fuzzy_select,
     is_pattern_in_gitignore,
     parse_github_url,
+    run_git,
     style_dim,
     style_error,
     style_info,
@@ -25,9 +29,34 @@ from workflow_tools.common import (
     validate_github_owner,
 )
 from workflow_tools.common.direnv import setup_direnv as _setup_direnv
-from workflow_tools.common.github import run_gh, run_gh_json
+from workflow_tools.common.git import git_bin
+from workflow_tools.common.github import (
+    get_viewer_login,
+    gh_bin,
+    run_gh,
+    run_gh_json,
+)
 from workflow_tools.common.shell import output_cd as _output_cd
-from workflow_tools.rp.discovery import discover_repos, find_repo
+from workflow_tools.rp.discovery import discover_repos, locate_repo
+
+# Upper bound on concurrent clones for rp clone --all
+MAX_PARALLEL_CLONES = 8
+
+# gh repo list fetches 100 repos per GraphQL page, so this only costs extra
+# requests for accounts that actually have more than 100 repos
+GH_REPO_LIST_LIMIT = 1000
+
+# Seconds to wait for GitHub's SSH port before falling back to gh clone
+SSH_CONNECT_TIMEOUT = 10
+
+# Home directory prefix shown as ~, read once per process
+_HOME = str(Path.home())
+
+# Styled list row, built once rather than per repo. str.format never
+# re-parses its arguments, so braces in names and paths are safe.
+_LIST_ROW_TEMPLATE = (
+    f"  {click.style('{}', fg=CYAN, bold=True)} {click.style('{}', fg=DIM)}"
+)
 
 
 def output_cd(path: Path) -> None:
@@ -54,15 +83,76 @@ def setup_repo_direnv(repo_path: Path) -> None:
             click.echo(style_warn("direnv not installed — .envrc won't auto-activate"))
 
 
+@functools.cache
+def _global_ssh_command() -> str | None:
+    """core.sshCommand from the user's global git config, read once.
+
+    A fresh clone doesn't see the config of whatever repo the user is in, so
+    only the global setting matters.
+    """
+    return run_git("config", "--global", "--get", "core.sshCommand")
+
+
+def ssh_clone(url: str, clone_path: Path) -> bool:
+    """Clone over SSH, giving up quickly if GitHub's SSH port is unreachable.
+
+    Networks that drop port 22 otherwise hang for the OS TCP timeout before
+    the gh clone fallback runs. An ssh command the user configured
+    (GIT_SSH_COMMAND, GIT_SSH or a global core.sshCommand) is left alone.
+    """
+    env = None
+    if not (
+        os.environ.get("GIT_SSH_COMMAND")
+        or os.environ.get("GIT_SSH")
+        or _global_ssh_command()
+    ):
+        env = {
+            **os.environ,
+            "GIT_SSH_COMMAND": f"ssh -o ConnectTimeout={SSH_CONNECT_TIMEOUT}",
+        }
+    result = subprocess.run(
+        [git_bin(), "clone", url, str(clone_path)],
+        check=False,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    return result.returncode == 0
+
+
+def clone_repo(name: str, clone_path: Path) -> bool:
+    """Clone one of the viewer's repos via gh (handles SSH/HTTPS automatically)."""
+    result = subprocess.run(
+        [gh_bin(), "repo", "clone", name, str(clone_path)],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    return result.returncode == 0
+
+
+def prefetch_viewer_login() -> Future[str | None]:
+    """Start looking up the viewer's login so it overlaps other gh calls."""
+    pool = ThreadPoolExecutor(max_workers=1)
+    future = pool.submit(get_viewer_login)
+    pool.shutdown(wait=False)
+    return future
+
+
+def tilde_path(path: Path) -> str:
+    """Format path for display with a leading home directory shown as ~."""
+    text = str(path)
+    if text == _HOME or text.startswith(_HOME + os.sep):
+        return "~" + text[len(_HOME) :]
+    return text
+
+
 def format_repo_options(repos: list[Path]) -> list[str]:
     """Format repos for picker: name + path."""
     if not repos:
         return []
     max_name = max(len(r.name) for r in repos)
-    return [
-        f"{r.name.ljust(max_name)}  {str(r).replace(str(Path.home()), '~')}"
-        for r in repos
-    ]
+    return [f"{r.name.ljust(max_name)}  {tilde_path(r)}" for r in repos]
 
 
 def select_directory(message: str, base_paths: list[Path] | None = None) -> Path | None:
@@ -76,16 +166,20 @@ def select_directory(message: str, base_paths: list[Path] | None = None) -> Path
         if not base.exists():
             continue
         dirs.append(base)
+        # DirEntry.is_dir uses the file type from readdir, so only symlinks
+        # (still offered when they point at a directory) cost a stat
         try:
-            dirs.extend(
-                child
-                for child in sorted(base.iterdir())
-                if child.is_dir() and not child.name.startswith(".")
-            )
+            with os.scandir(base) as it:
+                names = sorted(
+                    entry.name
+                    for entry in it
+                    if not entry.name.startswith(".") and entry.is_dir()
+                )
         except PermissionError:
             continue
+        dirs.extend(base / name for name in names)
 
-    options = [str(d).replace(str(Path.home()), "~") for d in dirs]
+    options = [tilde_path(d) for d in dirs]
     options.append("[+] Enter custom path...")
 
     index = fuzzy_select(options, message)
@@ -139,13 +233,8 @@ def switch_cmd(name: str | None) -> None:
         rp                      # Interactive: pick repo
         rp switch workflow      # Switch to repo named 'workflow'
     """
-    repos = discover_repos()
-    if not repos:
-        click.echo(style_error("No repositories found"), err=True)
-        sys.exit(1)
-
     if name:
-        repo = find_repo(name, repos)
+        repo = locate_repo(name)
         if not repo:
             click.echo(style_error(f"Repository '{name}' not found"), err=True)
             sys.exit(1)
@@ -153,6 +242,11 @@ def switch_cmd(name: str | None) -> None:
         setup_repo_direnv(repo)
         return
 
+    repos = discover_repos()
+    if not repos:
+        click.echo(style_error("No repositories found"), err=True)
+        sys.exit(1)
+
     # Interactive selection
     options = format_repo_options(repos)
     index = fuzzy_select(options, "Select repository")
@@ -191,9 +285,7 @@ def list_cmd(*, as_json: bool, path_only: bool) -> None:
 
     max_name = max(len(r.name) for r in repos)
     for r in repos:
-        name_styled = click.style(r.name.ljust(max_name), fg=CYAN, bold=True)
-        path_styled = click.style(str(r).replace(str(Path.home()), "~"), fg=DIM)
-        click.echo(f"  {name_styled} {path_styled}")
+        click.echo(_LIST_ROW_TEMPLATE.format(r.name.ljust(max_name), tilde_path(r)))
 
 
 @cli.command()
@@ -269,27 +361,17 @@ def create(
 
     # Clone via SSH
     click.echo(style_info(f"Cloning to {clone_path}..."))
-    clone_result = subprocess.run(
-        [
-            "git",
-            "clone",
-            f"git@github.com:{owner}/{name}.git",
-            str(clone_path),
-        ],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-
-    if clone_result.returncode != 0:
+    cloned = ssh_clone(f"git@github.com:{owner}/{name}.git", clone_path)
+    if not cloned:
         # Try HTTPS as fallback
         click.echo(style_warn("SSH clone failed, trying HTTPS..."))
-        subprocess.run(
-            ["gh", "repo", "clone", name, str(clone_path)],
+        fallback = subprocess.run(
+            [gh_bin(), "repo", "clone", name, str(clone_path)],
             check=False,
         )
+        cloned = fallback.returncode == 0
 
-    if clone_path.exists():
+    if cloned:
         click.echo(style_success(f"Cloned to {clone_path}"))
         output_cd(clone_path)
         setup_repo_direnv(clone_path)
@@ -343,6 +425,9 @@ def fork(
 
         repo = result[index]["fullName"]
 
+    # The clone URL needs the viewer's login; fetch it while the fork runs
+    viewer_future = None if no_clone else prefetch_viewer_login()
+
     # Fork on GitHub
     click.echo(style_info(f"Forking {repo}..."))
     fork_result = run_gh("repo", "fork", repo, "--clone=false")
@@ -371,34 +456,30 @@ def fork(
     clone_path = dest_dir / repo_name
 
     # Get viewer's username for the fork URL
-    viewer = run_gh("api", "user", "--jq", ".login")
+    viewer = viewer_future.result() if viewer_future else None
     if not viewer:
         click.echo(style_error("Could not determine your GitHub username"), err=True)
         sys.exit(1)
 
     # Clone via SSH
     click.echo(style_info(f"Cloning to {clone_path}..."))
-    clone_result = subprocess.run(
-        [
-            "git",
-            "clone",
-            f"git@github.com:{viewer.strip()}/{repo_name}.git",
-            str(clone_path),
-        ],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-
-    if clone_result.returncode != 0:
+    cloned = ssh_clone(f"git@github.com:{viewer.strip()}/{repo_name}.git", clone_path)
+    if not cloned:
         # Try with gh clone as fallback
         click.echo(style_warn("SSH clone failed, trying gh clone..."))
-        subprocess.run(
-            ["gh", "repo", "clone", f"{viewer.strip()}/{repo_name}", str(clone_path)],
+        fallback = subprocess.run(
+            [
+                gh_bin(),
+                "repo",
+                "clone",
+                f"{viewer.strip()}/{repo_name}",
+                str(clone_path),
+            ],
             check=False,
         )
+        cloned = fallback.returncode == 0
 
-    if clone_path.exists():
+    if cloned:
         click.echo(style_success(f"Cloned to {clone_path}"))
         output_cd(clone_path)
         setup_repo_direnv(clone_path)
@@ -423,20 +504,23 @@ def clone(repo_name: str | None, path: str | None, *, clone_all: bool) -> None:
         rp clone my-repo      # Clone specific repo
         rp clone -p ~/Code    # Clone to specific directory
     """
-    # Get user's repos from GitHub
+    # Get user's repos from GitHub, scanning for local repos (to check what's
+    # already cloned) while gh runs
     click.echo(style_info("Fetching your repositories..."))
-    gh_repos = run_gh_json(
-        "repo", "list", "--json", "name,url,description", "--limit", "100"
-    )
-    if not gh_repos:
-        click.echo(style_error("Failed to fetch repositories"), err=True)
-        sys.exit(1)
-
-    # Get local repos to check what's already cloned
-    local_repos = discover_repos()
-    local_names = {r.name for r in local_repos}
-    # Build lookup dict for O(1) access instead of O(n) search
-    local_repos_by_name = {r.name: r for r in local_repos}
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        local_future = pool.submit(discover_repos)
+        gh_repos = run_gh_json(
+            "repo",
+            "list",
+            "--json",
+            "name,url,description",
+            "--limit",
+            str(GH_REPO_LIST_LIMIT),
+        )
+        if not gh_repos:
+            click.echo(style_error("Failed to fetch repositories"), err=True)
+            sys.exit(1)
+        local_repos_by_name = {r.name: r for r in local_future.result()}
 
     if repo_name:
         # Direct clone
@@ -445,14 +529,13 @@ def clone(repo_name: str | None, path: str | None, *, clone_all: bool) -> None:
             click.echo(style_error(f"Repository '{repo_name}' not found"), err=True)
             sys.exit(1)
 
-        if repo_name in local_names:
-            # Find path and switch to it
-            local_path = local_repos_by_name.get(repo_name)
-            if local_path:
-                click.echo(style_info(f"'{repo_name}' already cloned at {local_path}"))
-                output_cd(local_path)
-                setup_repo_direnv(local_path)
-                return
+        local_path = local_repos_by_name.get(repo_name)
+        if local_path:
+            # Already cloned, switch to it
+            click.echo(style_info(f"'{repo_name}' already cloned at {local_path}"))
+            output_cd(local_path)
+            setup_repo_direnv(local_path)
+            return
         repos_to_clone = matching
     else:
         # Interactive selection
@@ -461,15 +544,12 @@ def clone(repo_name: str | None, path: str | None, *, clone_all: bool) -> None:
         for r in gh_repos:
             name = r["name"]
             desc = r.get("description", "")[:40] or ""
-            if name in local_names:
-                local_path = local_repos_by_name.get(name)
-                if local_path:
-                    short_path = str(local_path).replace(str(Path.home()), "~")
-                    options.append(
-                        f"{name}  {click.style(f'[cloned: {short_path}]', fg='green')}"
-                    )
-                else:
-                    options.append(f"{name}  {click.style(desc, fg=DIM)}")
+            local_path = local_repos_by_name.get(name)
+            if local_path:
+                short_path = tilde_path(local_path)
+                options.append(
+                    f"{name}  {click.style(f'[cloned: {short_path}]', fg='green')}"
+                )
             else:
                 options.append(f"{name}  {click.style(desc, fg=DIM)}")
                 uncloned_repos.append(r)
@@ -486,14 +566,13 @@ def clone(repo_name: str | None, path: str | None, *, clone_all: bool) -> None:
                 return
 
             selected = gh_repos[index]
-            if selected["name"] in local_names:
+            local_path = local_repos_by_name.get(selected["name"])
+            if local_path:
                 # Switch to existing repo
-                local_path = local_repos_by_name.get(selected["name"])
-                if local_path:
-                    click.echo(style_info(f"Already cloned, switching to {local_path}"))
-                    output_cd(local_path)
-                    setup_repo_direnv(local_path)
-                    return
+                click.echo(style_info(f"Already cloned, switching to {local_path}"))
+                output_cd(local_path)
+                setup_repo_direnv(local_path)
+                return
             repos_to_clone = [selected]
 
     # Determine destination
@@ -508,6 +587,7 @@ def clone(repo_name: str | None, path: str | None, *, clone_all: bool) -> None:
         dest_dir = selected
 
     # Clone the repos
+    pending: dict[str, Path] = {}
     for repo in repos_to_clone:
         name = repo["name"]
         clone_path = dest_dir / name
@@ -517,26 +597,31 @@ def clone(repo_name: str | None, path: str | None, *, clone_all: bool) -> None:
             continue
 
         click.echo(style_info(f"Cloning {name}..."))
-
-        # Clone via gh (handles SSH/HTTPS automatically)
-        result = subprocess.run(
-            ["gh", "repo", "clone", name, str(clone_path)],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-
-        if result.returncode == 0 and clone_path.exists():
-            click.echo(style_success(f"Cloned {name} to {clone_path}"))
-        else:
-            click.echo(style_error(f"Failed to clone {name}"), err=True)
+        pending[name] = clone_path
+
+    cloned: set[str] = set()
+    if pending:
+        # Clones are network-bound and independent, so run several at once;
+        # results are reported from this thread as each one finishes
+        workers = min(MAX_PARALLEL_CLONES, len(pending))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(clone_repo, name, clone_path): name
+                for name, clone_path in pending.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                if future.result():
+                    cloned.add(name)
+                    click.echo(style_success(f"Cloned {name} to {pending[name]}"))
+                else:
+                    click.echo(style_error(f"Failed to clone {name}"), err=True)
 
     # If single repo cloned, cd to it
-    if len(repos_to_clone) == 1:
-        clone_path = dest_dir / repos_to_clone[0]["name"]
-        if clone_path.exists():
-            output_cd(clone_path)
-            setup_repo_direnv(clone_path)
+    if len(repos_to_clone) == 1 and repos_to_clone[0]["name"] in cloned:
+        clone_path = pending[repos_to_clone[0]["name"]]
+        output_cd(clone_path)
+        setup_repo_direnv(clone_path)
 
 
 @cli.command()
@@ -554,12 +639,12 @@ def rename(
         rp rename old-name new-name --local-only   # Local only
         rp rename old-name new-name --github-only  # GitHub only
     """
-    repos = discover_repos()
-    repo = find_repo(old_name, repos)
     old_path: Path | None = None
     new_path: Path | None = None
 
+    # Only a local rename needs to find the repo on disk
     if not github_only:
+        repo = locate_repo(old_name)
         if not repo:
             click.echo(
                 style_error(f"Repository '{old_name}' not found locally"), err=True
@@ -583,6 +668,8 @@ def rename(
         click.echo(
             style_info(f"Renaming repository on GitHub: {old_name} → {new_name}")
         )
+        # The new remote URL needs the viewer's login; fetch it alongside
+        viewer_future = None if github_only else prefetch_viewer_login()
         result = run_gh("repo", "rename", new_name, "-y")
         if result is None:
             click.echo(style_error("Failed to rename on GitHub"), err=True)
@@ -600,20 +687,20 @@ def rename(
         click.echo(style_success("Renamed on GitHub"))
 
         # Update git remote URL if we renamed locally
-        if not github_only and new_path:
-            viewer = run_gh("api", "user", "--jq", ".login")
+        if viewer_future and new_path:
+            viewer = viewer_future.result()
             if viewer:
                 # Validate the viewer login before using in URL
                 try:
                     validated_viewer = validate_github_owner(viewer.strip())
                     new_url = f"git@github.com:{validated_viewer}/{new_name}.git"
-                    subprocess.run(
-                        ["git", "remote", "set-url", "origin", new_url],
-                        cwd=new_path,
-                        check=False,
-                        capture_output=True,
+                    result = run_git(
+                        "remote", "set-url", "origin", new_url, cwd=new_path
                     )
-                    click.echo(style_info(f"Updated remote URL to {new_url}"))
+                    if result is None:
+                        click.echo(style_warn("Could not update remote URL"), err=True)
+                    else:
+                        click.echo(style_info(f"Updated remote URL to {new_url}"))
                 except ValidationError as e:
                     click.echo(
                         style_warn(f"Could not update remote URL: {e}"), err=True
@@ -1,22 +1,59 @@
-"""Fast repository discovery using shallow find."""
+"""Fast repository discovery using a shallow parallel directory scan."""
 
 from __future__ import annotations
 
-import subprocess
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Look for .git directories at most this many levels below a scan path
+# (the same as `find -maxdepth 3 -name .git`)
+MAX_DEPTH = 3
+
+# Dependency and tool directories that never hold a user's repos but can
+# hold thousands of subdirectories (and vendored .git directories)
+PRUNE_DIRS = frozenset(
+    {"node_modules", ".venv", "venv", "__pycache__", ".tox", ".mypy_cache"}
+)
+
+
+def _scan_dir(path: str) -> tuple[list[str], bool]:
+    """List a directory's subdirectories and whether it has a .git directory.
+
+    Symlinks are not followed, PRUNE_DIRS are left out and unreadable
+    directories are treated as empty.
+    """
+    subdirs: list[str] = []
+    has_git = False
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+                if entry.name == ".git":
+                    has_git = True
+                elif entry.name not in PRUNE_DIRS:
+                    subdirs.append(entry.path)
+    except OSError:
+        pass
+    return subdirs, has_git
 
-def discover_repos(scan_paths: list[Path] | None = None) -> list[Path]:
-    """Find git repos under scan_paths (default: ~/Documents).
 
-    Uses maxdepth 3 for speed (~0.25s). Returns sorted list of repo paths.
+def _iter_repo_levels(scan_paths: list[Path] | None) -> Iterator[list[Path]]:
+    """Yield the repos found at each depth under scan_paths, shallowest first.
+
+    Scans MAX_DEPTH levels deep, one level at a time with the directories of
+    each level listed concurrently. Stopping early skips the deeper levels,
+    which hold the most directories.
     """
     if scan_paths is None:
         scan_paths = [Path.home() / "Documents"]
 
-    repos: list[Path] = []
-    seen: set[str] = set()
-
+    level: list[str] = []
     for base in scan_paths:
         if not base.exists():
             continue
@@ -30,38 +67,55 @@ def discover_repos(scan_paths: list[Path] | None = None) -> list[Path]:
         except (OSError, ValueError):
             continue
 
-        try:
-            result = subprocess.run(
-                [
-                    "find",
-                    str(resolved_base),
-                    "-maxdepth",
-                    "3",
-                    "-type",
-                    "d",
-                    "-name",
-                    ".git",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10,
-                check=False,
-            )
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            continue
+        if str(resolved_base) not in level:
+            level.append(str(resolved_base))
 
-        for line in result.stdout.strip().split("\n"):
-            if not line:
-                continue
-            repo_path = Path(line).parent
-            path_str = str(repo_path)
-            if path_str not in seen:
-                seen.add(path_str)
-                repos.append(repo_path)
+    seen: set[str] = set()
 
+    # os.scandir releases the GIL, so threads overlap the directory reads
+    with ThreadPoolExecutor() as pool:
+        for _ in range(MAX_DEPTH):
+            repos: list[Path] = []
+            next_level: list[str] = []
+            for path, (subdirs, has_git) in zip(
+                level, pool.map(_scan_dir, level), strict=True
+            ):
+                if has_git and path not in seen:
+                    seen.add(path)
+                    repos.append(Path(path))
+                next_level.extend(subdirs)
+            yield repos
+            level = next_level
+
+
+def discover_repos(scan_paths: list[Path] | None = None) -> list[Path]:
+    """Find git repos under scan_paths (default: ~/Documents).
+
+    Returns sorted list of repo paths.
+    """
+    repos = [r for level in _iter_repo_levels(scan_paths) for r in level]
     return sorted(repos, key=lambda p: p.name.lower())
 
 
+def locate_repo(name_or_path: str, scan_paths: list[Path] | None = None) -> Path | None:
+    """Find a repo by name or path under scan_paths (default: ~/Documents).
+
+    Same result as find_repo(name_or_path, discover_repos(scan_paths)), but a
+    name lookup stops scanning at the shallowest level with a match. Equal
+    names sort in scan order, so that level holds find_repo's answer too.
+    """
+    # Discovered paths are absolute, so only a path can match exactly
+    if os.sep in name_or_path:
+        return find_repo(name_or_path, discover_repos(scan_paths))
+
+    name_lower = name_or_path.lower()
+    for level in _iter_repo_levels(scan_paths):
+        for r in level:
+            if r.name.lower() == name_lower:
+                return r
+    return None
+
+
 def find_repo(name_or_path: str, repos: list[Path]) -> Path | None:
     """Find a repo by name or path from a list."""
     # Exact path match
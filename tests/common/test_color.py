@@ -0,0 +1,142 @@
+"""Tests for color and workspace file utilities."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from workflow_tools.common.color import (
+    add_pattern_to_gitignore,
+    create_workspace_file,
+    darken_color,
+    find_workspace_file,
+    foreground_for,
+    is_pattern_in_gitignore,
+    read_workspace_color,
+)
+
+
+class TestDarkenColor:
+    """Tests for darken_color function."""
+
+    def test_halves_each_channel(self) -> None:
+        """darken_color scales each channel by the remaining percentage."""
+        assert darken_color("CC3333") == "661919"
+
+    def test_accepts_hash_prefix(self) -> None:
+        """darken_color ignores a leading #."""
+        assert darken_color("#FFFFFF", 25) == "BFBFBF"
+
+    def test_zero_percent_is_identity(self) -> None:
+        """darken_color with 0% returns the same color."""
+        assert darken_color("2B6CB0", 0) == "2B6CB0"
+
+
+class TestForegroundFor:
+    """Tests for foreground_for function."""
+
+    def test_light_background(self) -> None:
+        """foreground_for picks black text on light colors."""
+        assert foreground_for("D4A017") == "#000000"
+        assert foreground_for("#FFFFFF") == "#000000"
+
+    def test_dark_background(self) -> None:
+        """foreground_for picks white text on dark colors."""
+        assert foreground_for("2B6CB0") == "#FFFFFF"
+        assert foreground_for("000000") == "#FFFFFF"
+
+
+class TestIsPatternInGitignore:
+    """Tests for is_pattern_in_gitignore function."""
+
+    def test_finds_exact_line(self, tmp_path: Path) -> None:
+        """is_pattern_in_gitignore matches a whole line, ignoring whitespace."""
+        (tmp_path / ".gitignore").write_text("node_modules/\n  .envrc  \n")
+
+        assert is_pattern_in_gitignore(tmp_path, ".envrc")
+        assert not is_pattern_in_gitignore(tmp_path, "envrc")
+
+    def test_missing_gitignore(self, tmp_path: Path) -> None:
+        """is_pattern_in_gitignore returns False when .gitignore is absent."""
+        assert not is_pattern_in_gitignore(tmp_path, ".envrc")
+
+    def test_sees_updates_after_add(self, tmp_path: Path) -> None:
+        """is_pattern_in_gitignore picks up patterns added after a lookup."""
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        assert not is_pattern_in_gitignore(tmp_path, ".envrc")
+
+        add_pattern_to_gitignore(tmp_path, ".envrc")
+
+        assert is_pattern_in_gitignore(tmp_path, ".envrc")
+
+
+class TestAddPatternToGitignore:
+    """Tests for add_pattern_to_gitignore function."""
+
+    def test_creates_file(self, tmp_path: Path) -> None:
+        """add_pattern_to_gitignore creates .gitignore if missing."""
+        add_pattern_to_gitignore(tmp_path, ".envrc")
+
+        content = (tmp_path / ".gitignore").read_text()
+        assert content == "\n# Auto-generated by wt (workflow-tools)\n.envrc\n"
+
+    def test_adds_missing_trailing_newline(self, tmp_path: Path) -> None:
+        """add_pattern_to_gitignore terminates the last line before appending."""
+        (tmp_path / ".gitignore").write_text("*.log")
+
+        add_pattern_to_gitignore(tmp_path, ".envrc")
+
+        content = (tmp_path / ".gitignore").read_text()
+        assert content == "*.log\n\n# Auto-generated by wt (workflow-tools)\n.envrc\n"
+
+
+class TestFindWorkspaceFile:
+    """Tests for find_workspace_file function."""
+
+    def test_finds_workspace_file(self, tmp_path: Path) -> None:
+        """find_workspace_file returns the .local.code-workspace file."""
+        (tmp_path / "README.md").write_text("")
+        workspace = tmp_path / "feature.local.code-workspace"
+        workspace.write_text("{}")
+
+        assert find_workspace_file(tmp_path) == workspace
+
+    def test_returns_none_without_match(self, tmp_path: Path) -> None:
+        """find_workspace_file ignores other workspace files."""
+        (tmp_path / "shared.code-workspace").write_text("{}")
+
+        assert find_workspace_file(tmp_path) is None
+
+
+class TestCreateWorkspaceFile:
+    """Tests for create_workspace_file function."""
+
+    def test_round_trips_color(self, tmp_git_repo: Path) -> None:
+        """create_workspace_file writes a file read_workspace_color understands."""
+        path = create_workspace_file(tmp_git_repo, "#2B6CB0")
+
+        assert path.name.endswith(".local.code-workspace")
+        assert path.read_text().endswith("}\n")
+        assert read_workspace_color(tmp_git_repo) == "2B6CB0"
+
+    def test_follows_branch_checkout(self, tmp_git_repo: Path) -> None:
+        """create_workspace_file names the file after the current branch."""
+        create_workspace_file(tmp_git_repo, "2B6CB0")
+        subprocess.run(
+            ["git", "checkout", "-b", "feature/x"],
+            cwd=tmp_git_repo,
+            capture_output=True,
+            check=True,
+        )
+
+        path = create_workspace_file(tmp_git_repo, "2B6CB0")
+
+        assert path.name == "feature-x.local.code-workspace"
+
+    def test_unborn_head_uses_default_name(self, tmp_path: Path) -> None:
+        """create_workspace_file falls back to 'default' before the first commit."""
+        subprocess.run(["git", "init"], cwd=tmp_path, capture_output=True, check=True)
+
+        path = create_workspace_file(tmp_path, "2B6CB0")
+
+        assert path.name == "default.local.code-workspace"
@@ -10,6 +10,7 @@ from workflow_tools.common.git import (
     find_repo_root,
     get_current_branch,
     get_default_branch,
+    invalidate_git_caches,
     is_repo_dirty,
     list_branches,
     run_git,
@@ -123,6 +124,33 @@ class TestGetDefaultBranch:
         branch = get_default_branch(tmp_path)
         assert branch == "main"  # fallback
 
+    def test_invalidate_picks_up_new_default(self, tmp_git_repo: Path) -> None:
+        """get_default_branch is cached until invalidate_git_caches is called."""
+        initial = get_default_branch(tmp_git_repo)
+        subprocess.run(
+            ["git", "update-ref", "refs/remotes/origin/trunk", "HEAD"],
+            cwd=tmp_git_repo,
+            capture_output=True,
+            check=True,
+        )
+        subprocess.run(
+            [
+                "git",
+                "symbolic-ref",
+                "refs/remotes/origin/HEAD",
+                "refs/remotes/origin/trunk",
+            ],
+            cwd=tmp_git_repo,
+            capture_output=True,
+            check=True,
+        )
+
+        assert get_default_branch(tmp_git_repo) == initial
+
+        invalidate_git_caches()
+
+        assert get_default_branch(tmp_git_repo) == "trunk"
+
 
 class TestListBranches:
     """Tests for list_branches function."""
@@ -148,6 +176,32 @@ class TestListBranches:
         assert "feature" in branches
         assert any(b in branches for b in ("main", "master"))
 
+    def test_lists_remote_branches_without_head(self, tmp_git_repo: Path) -> None:
+        """list_branches includes remotes after locals and skips origin/HEAD."""
+        subprocess.run(
+            ["git", "update-ref", "refs/remotes/origin/feature", "HEAD"],
+            cwd=tmp_git_repo,
+            capture_output=True,
+            check=True,
+        )
+        subprocess.run(
+            [
+                "git",
+                "symbolic-ref",
+                "refs/remotes/origin/HEAD",
+                "refs/remotes/origin/feature",
+            ],
+            cwd=tmp_git_repo,
+            capture_output=True,
+            check=True,
+        )
+
+        branches = list_branches(tmp_git_repo)
+
+        assert branches[-1] == "origin/feature"
+        assert not any("HEAD" in b for b in branches)
+        assert list_branches(tmp_git_repo, include_remote=False) == branches[:-1]
+
 
 class TestIsRepoDirty:
     """Tests for is_repo_dirty function."""
@@ -0,0 +1,67 @@
+"""Tests for GitHub CLI helpers."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from workflow_tools.common.github import get_viewer_login
+
+
+@pytest.fixture
+def gh_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point gh's config and our cache at temp dirs; returns the cache file."""
+    monkeypatch.setenv("GH_CONFIG_DIR", str(tmp_path / "gh"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    (tmp_path / "gh").mkdir()
+    (tmp_path / "gh" / "hosts.yml").write_text("github.com:\n")
+    get_viewer_login.cache_clear()
+    yield tmp_path / "cache" / "workflow-tools" / "viewer.json"
+    get_viewer_login.cache_clear()
+
+
+class TestGetViewerLogin:
+    """Tests for get_viewer_login function."""
+
+    def test_reuses_disk_cache(self, gh_dirs: Path, mocker: Any) -> None:
+        """get_viewer_login reads the login cached by an earlier run."""
+        run_gh = mocker.patch(
+            "workflow_tools.common.github.run_gh", return_value="alice\n"
+        )
+
+        assert get_viewer_login() == "alice"
+        get_viewer_login.cache_clear()
+        assert get_viewer_login() == "alice"
+
+        run_gh.assert_called_once()
+        assert json.loads(gh_dirs.read_text())["login"] == "alice"
+
+    def test_auth_change_invalidates(self, gh_dirs: Path, mocker: Any) -> None:
+        """get_viewer_login looks the login up again after gh auth changes."""
+        mocker.patch(
+            "workflow_tools.common.github.run_gh", side_effect=["alice", "bob"]
+        )
+        assert get_viewer_login() == "alice"
+
+        cached = json.loads(gh_dirs.read_text())
+        cached["auth"] -= 1
+        gh_dirs.write_text(json.dumps(cached))
+        get_viewer_login.cache_clear()
+
+        assert get_viewer_login() == "bob"
+
+    def test_env_token_skips_disk_cache(
+        self, gh_dirs: Path, mocker: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """get_viewer_login doesn't persist logins for GH_TOKEN auth."""
+        monkeypatch.setenv("GH_TOKEN", "t")
+        mocker.patch("workflow_tools.common.github.run_gh", return_value="alice")
+
+        assert get_viewer_login() == "alice"
+        assert not gh_dirs.exists()
@@ -0,0 +1,50 @@
+"""Tests for shell integration utilities."""
+
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING, Any
+
+from workflow_tools.common.shell import open_url
+
+if TYPE_CHECKING:
+    import pytest
+
+
+class TestOpenUrl:
+    """Tests for open_url function."""
+
+    def test_launches_browser_env_detached(
+        self, mocker: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """open_url starts $BROWSER in its own session with the URL appended."""
+        monkeypatch.setenv("BROWSER", "code --reuse-window")
+        mock_popen = mocker.patch("workflow_tools.common.shell.subprocess.Popen")
+
+        assert open_url("https://github.com/o/r/pull/1") is True
+
+        args, kwargs = mock_popen.call_args
+        assert args[0] == ["code", "--reuse-window", "https://github.com/o/r/pull/1"]
+        assert kwargs["start_new_session"] is True
+        assert kwargs["stdout"] is subprocess.DEVNULL
+
+    def test_substitutes_placeholder(
+        self, mocker: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """open_url fills in %s instead of appending the URL."""
+        monkeypatch.setenv("BROWSER", "open -u %s")
+        mock_popen = mocker.patch("workflow_tools.common.shell.subprocess.Popen")
+
+        open_url("https://example.com")
+
+        assert mock_popen.call_args[0][0] == ["open", "-u", "https://example.com"]
+
+    def test_falls_back_to_webbrowser(
+        self, mocker: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """open_url uses the webbrowser module when $BROWSER is unset."""
+        monkeypatch.delenv("BROWSER", raising=False)
+        mock_open = mocker.patch("webbrowser.open", return_value=False)
+
+        assert open_url("https://example.com") is False
+        mock_open.assert_called_once_with("https://example.com")
@@ -0,0 +1,42 @@
+"""Tests for shared UI utilities."""
+
+from __future__ import annotations
+
+import subprocess
+from typing import Any
+
+from workflow_tools.common.ui import fuzzy_select, fuzzy_select_multi
+
+
+def _fzf_result(mocker: Any, stdout: str, returncode: int = 0) -> Any:
+    """Pretend fzf is installed and returns stdout."""
+    mocker.patch("workflow_tools.common.ui._fzf_bin", return_value="/usr/bin/fzf")
+    return mocker.patch(
+        "workflow_tools.common.ui.subprocess.run",
+        return_value=subprocess.CompletedProcess([], returncode, stdout=stdout),
+    )
+
+
+class TestFuzzySelectFzf:
+    """Tests for the fzf path of fuzzy_select and fuzzy_select_multi."""
+
+    def test_returns_index_of_duplicate_label(self, mocker: Any) -> None:
+        """fuzzy_select maps fzf's line back to the option's index."""
+        run = _fzf_result(mocker, "1\tsame\n")
+
+        assert fuzzy_select(["same", "same"], "Pick") == 1
+        assert run.call_args.kwargs["input"] == "0\tsame\n1\tsame"
+        assert "--exact" in run.call_args.args[0]
+
+    def test_cancel_returns_none(self, mocker: Any) -> None:
+        """fuzzy_select returns None when fzf is cancelled."""
+        _fzf_result(mocker, "", returncode=130)
+
+        assert fuzzy_select(["a"], "Pick") is None
+
+    def test_multi_returns_all_indices(self, mocker: Any) -> None:
+        """fuzzy_select_multi returns every selected index."""
+        run = _fzf_result(mocker, "0\ta\n2\tc\n")
+
+        assert fuzzy_select_multi(["a", "b", "c"], "Pick") == [0, 2]
+        assert "--multi" in run.call_args.args[0]
@@ -64,6 +64,10 @@ class TestValidateWorktreeName:
         with pytest.raises(ValidationError, match="alphanumeric"):
             validate_worktree_name("feature$name")
 
+    def test_trailing_newline_rejected(self) -> None:
+        with pytest.raises(ValidationError, match="alphanumeric"):
+            validate_worktree_name("feature\n")
+
 
 class TestValidateBranchName:
     """Tests for validate_branch_name."""
@@ -90,6 +94,10 @@ class TestValidateBranchName:
         with pytest.raises(ValidationError, match="contains"):
             validate_branch_name("feature^2")
 
+    def test_reports_first_forbidden_char(self) -> None:
+        with pytest.raises(ValidationError, match="contains ' '"):
+            validate_branch_name("my feature?")
+
     def test_leading_slash_rejected(self) -> None:
         with pytest.raises(ValidationError, match="start or end"):
             validate_branch_name("/feature")
@@ -242,6 +250,14 @@ class TestValidatePathNoTraversal:
         with pytest.raises(ValidationError, match="must be within"):
             validate_path_no_traversal(str(outside_file), base_dir=base)
 
+    def test_sibling_with_shared_prefix_rejected(self, tmp_path: Path) -> None:
+        base = tmp_path / "base"
+        base.mkdir()
+        sibling = tmp_path / "base2"
+        sibling.mkdir()
+        with pytest.raises(ValidationError, match="must be within"):
+            validate_path_no_traversal(str(sibling / "file.txt"), base_dir=base)
+
 
 class TestValidateTempPath:
     """Tests for validate_temp_path."""
@@ -293,3 +309,10 @@ class TestParseGithubUrl:
     def test_trailing_slash(self) -> None:
         result = parse_github_url("https://github.com/owner/repo/")
         assert result == ("owner", "repo")
+
+    def test_ssh_scheme_url(self) -> None:
+        result = parse_github_url("ssh://git@github.com/owner/repo.git")
+        assert result == ("owner", "repo")
+
+    def test_extra_path_segments_return_none(self) -> None:
+        assert parse_github_url("https://github.com/owner/repo/tree/main") is None
@@ -3,17 +3,26 @@
 from __future__ import annotations
 
 import json
+from pathlib import Path
 from subprocess import CalledProcessError
 from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
+
 from workflow_tools.pr.api import (
     PRListInfo,
+    PRSummary,
     format_date,
     get_current_branch,
     get_pr_files,
     get_pr_for_branch,
+    get_pr_full_context,
+    iter_pr_diff,
+    list_open_prs,
     list_prs_simple,
+    reply_to_thread,
+    resolve_threads,
 )
 
 
@@ -43,24 +52,10 @@ class TestListPrsSimple:
     """Tests for list_prs_simple function."""
 
     def test_parses_pr_list(self, mocker: Any) -> None:
-        """list_prs_simple parses gh pr list output."""
-        mock_data = [
-            {
-                "number": 1,
-                "title": "First PR",
-                "headRefName": "feature-1",
-                "isDraft": False,
-            },
-            {
-                "number": 2,
-                "title": "Second PR",
-                "headRefName": "feature-2",
-                "isDraft": True,
-            },
-        ]
+        """list_prs_simple parses gh pr list tab-separated output."""
         mocker.patch(
             "workflow_tools.pr.api.run_gh",
-            return_value=json.dumps(mock_data),
+            return_value="1\tfalse\tfeature-1\tFirst PR\n2\ttrue\tfeature-2\tSecond PR",
         )
 
         prs = list_prs_simple()
@@ -73,6 +68,17 @@ class TestListPrsSimple:
             number=2, title="Second PR", branch="feature-2", is_draft=True
         )
 
+    def test_unescapes_title(self, mocker: Any) -> None:
+        """list_prs_simple undoes @tsv escaping in titles."""
+        mocker.patch(
+            "workflow_tools.pr.api.run_gh",
+            return_value="3\tfalse\tfix\tUse C:\\\\temp\\tnow",
+        )
+
+        prs = list_prs_simple()
+
+        assert prs[0].title == "Use C:\\temp\tnow"
+
     def test_returns_empty_list_on_error(self, mocker: Any) -> None:
         """list_prs_simple returns empty list when gh fails."""
         mocker.patch("workflow_tools.pr.api.run_gh", return_value=None)
@@ -81,17 +87,28 @@ class TestListPrsSimple:
 
         assert prs == []
 
-    def test_handles_invalid_json(self, mocker: Any) -> None:
-        """list_prs_simple handles invalid JSON gracefully."""
+    def test_handles_malformed_output(self, mocker: Any) -> None:
+        """list_prs_simple handles malformed output gracefully."""
         mocker.patch(
             "workflow_tools.pr.api.run_gh",
-            return_value="not valid json",
+            return_value="not valid output",
         )
 
         prs = list_prs_simple()
 
         assert prs == []
 
+    def test_skips_only_malformed_lines(self, mocker: Any) -> None:
+        """list_prs_simple keeps the valid PRs around a malformed line."""
+        mocker.patch(
+            "workflow_tools.pr.api.run_gh",
+            return_value="1\tfalse\ta\tOne\nx\tfalse\tb\tBad\nbroken\n3\ttrue\tc\tThree",
+        )
+
+        prs = list_prs_simple()
+
+        assert [pr.number for pr in prs] == [1, 3]
+
 
 class TestGetPrForBranch:
     """Tests for get_pr_for_branch function."""
@@ -149,6 +166,84 @@ class TestGetPrForBranch:
         assert pr.deletions == 0
 
 
+class TestListOpenPrs:
+    """Tests for list_open_prs function."""
+
+    def test_parses_pr_list(self, mocker: Any) -> None:
+        """list_open_prs builds PRSummary records from gh pr list output."""
+        mock_data = [
+            {
+                "number": 5,
+                "id": "PR_5",
+                "title": "Fix bug",
+                "url": "https://github.com/o/r/pull/5",
+                "author": {"login": "alice"},
+                "headRefName": "fix-bug",
+                "isDraft": True,
+            }
+        ]
+        mocker.patch("workflow_tools.pr.api.run_gh", return_value=json.dumps(mock_data))
+
+        prs = list_open_prs()
+
+        assert prs == [
+            PRSummary(
+                number=5,
+                id="PR_5",
+                title="Fix bug",
+                url="https://github.com/o/r/pull/5",
+                author="alice",
+                head_branch="fix-bug",
+                is_draft=True,
+            )
+        ]
+
+    def test_requests_past_default_limit(self, mocker: Any) -> None:
+        """list_open_prs raises gh's 30 PR default and passes filters through."""
+        mock_run = mocker.patch("workflow_tools.pr.api.run_gh", return_value="[]")
+
+        list_open_prs(author="alice", include_drafts=False)
+
+        args = mock_run.call_args[0]
+        assert args[args.index("--limit") + 1] == "1000"
+        assert args[args.index("--author") + 1] == "alice"
+        assert "--draft=false" in args
+
+
+class TestIterPrDiff:
+    """Tests for iter_pr_diff function."""
+
+    def test_streams_gh_output(self, mocker: Any) -> None:
+        """iter_pr_diff yields the lines gh writes."""
+        mocker.patch("workflow_tools.pr.api.gh_bin", return_value="echo")
+
+        assert list(iter_pr_diff(5)) == ["pr diff 5\n"]
+
+    def test_missing_gh_raises(self, mocker: Any) -> None:
+        """iter_pr_diff raises FileNotFoundError when gh isn't installed."""
+        mocker.patch(
+            "workflow_tools.pr.api.gh_bin", return_value="/nonexistent/gh-binary"
+        )
+
+        with pytest.raises(FileNotFoundError):
+            list(iter_pr_diff(5))
+
+    def test_failure_raises_with_stderr(self, mocker: Any, tmp_path: Path) -> None:
+        """iter_pr_diff raises with gh's stderr after yielding its output."""
+        fake_gh = tmp_path / "gh"
+        fake_gh.write_text("#!/bin/sh\necho partial\necho 'no such PR' >&2\nexit 1\n")
+        fake_gh.chmod(0o755)
+        mocker.patch("workflow_tools.pr.api.gh_bin", return_value=str(fake_gh))
+
+        lines: list[str] = []
+        with pytest.raises(CalledProcessError) as exc_info:
+            lines.extend(iter_pr_diff(5))
+
+        assert lines == ["partial\n"]
+        assert exc_info.value.returncode == 1
+        assert exc_info.value.stderr == "no such PR\n"
+
+
 class TestGetPrFiles:
     """Tests for get_pr_files function."""
 
@@ -183,6 +278,193 @@ class TestGetPrFiles:
         assert files == ["file1.py", "file2.py"]
 
 
+class TestGetPrFullContext:
+    """Tests for get_pr_full_context function."""
+
+    def test_parses_pr_threads_and_comments(self, mocker: Any) -> None:
+        """get_pr_full_context builds all three results from one query."""
+        pull_request = {
+            "number": 7,
+            "id": "PR_7",
+            "title": "Add feature",
+            "body": "Body",
+            "url": "https://github.com/o/r/pull/7",
+            "state": "OPEN",
+            "author": {"login": "alice"},
+            "baseRefName": "main",
+            "headRefName": "feature",
+            "isDraft": False,
+            "mergeable": "MERGEABLE",
+            "reviewDecision": None,
+            "additions": 3,
+            "deletions": 1,
+            "changedFiles": 2,
+            "comments": {
+                "nodes": [
+                    {
+                        "id": "IC_1",
+                        "author": {"login": "bob"},
+                        "body": "Looks good",
+                        "createdAt": "2024-01-15T10:30:00Z",
+                    }
+                ]
+            },
+            "reviewThreads": {
+                "nodes": [
+                    {
+                        "id": "PRRT_1",
+                        "isResolved": False,
+                        "isOutdated": False,
+                        "path": "src/app.py",
+                        "line": 10,
+                        "startLine": None,
+                        "comments": {"nodes": []},
+                    }
+                ]
+            },
+        }
+        graphql = mocker.patch(
+            "workflow_tools.pr.api.gh_api_graphql",
+            return_value={"data": {"repository": {"pullRequest": pull_request}}},
+        )
+
+        context = get_pr_full_context("o", "r", 7)
+
+        graphql.assert_called_once()
+        assert context is not None
+        pr, threads, comments = context
+        assert pr.head_branch == "feature"
+        assert pr.author == "alice"
+        assert [t.id for t in threads] == ["PRRT_1"]
+        assert comments[0].author == "bob"
+
+    def test_deleted_author_is_ghost(self, mocker: Any) -> None:
+        """get_pr_full_context accepts a null author from a deleted account."""
+        pull_request = {
+            "number": 8,
+            "id": "PR_8",
+            "title": "Old",
+            "url": "https://github.com/o/r/pull/8",
+            "state": "OPEN",
+            "author": None,
+            "baseRefName": "main",
+            "headRefName": "old",
+            "isDraft": False,
+            "comments": {"nodes": []},
+            "reviewThreads": {"nodes": []},
+        }
+        mocker.patch(
+            "workflow_tools.pr.api.gh_api_graphql",
+            return_value={"data": {"repository": {"pullRequest": pull_request}}},
+        )
+
+        context = get_pr_full_context("o", "r", 8)
+
+        assert context is not None
+        assert context[0].author == "ghost"
+
+    def test_returns_none_when_pr_missing(self, mocker: Any) -> None:
+        """get_pr_full_context returns None when the PR doesn't exist."""
+        mocker.patch(
+            "workflow_tools.pr.api.gh_api_graphql",
+            return_value={"data": {"repository": {"pullRequest": None}}},
+        )
+
+        assert get_pr_full_context("o", "r", 404) is None
+
+
+class TestReplyToThread:
+    """Tests for reply_to_thread function."""
+
+    def test_known_comment_id_skips_lookup(self, mocker: Any) -> None:
+        """reply_to_thread with comment_id only sends the reply mutation."""
+        graphql = mocker.patch(
+            "workflow_tools.pr.api.gh_api_graphql",
+            return_value={"data": {"addPullRequestReviewComment": {}}},
+        )
+
+        result, pending_review_id = reply_to_thread(
+            "PRRT_1", "Done", "PR_1", comment_id="C_1"
+        )
+
+        assert result.success
+        assert pending_review_id is None
+        graphql.assert_called_once()
+        assert graphql.call_args.args[1]["commentId"] == "C_1"
+
+    def test_looks_up_first_comment(self, mocker: Any) -> None:
+        """reply_to_thread fetches the first comment ID when not given."""
+        graphql = mocker.patch(
+            "workflow_tools.pr.api.gh_api_graphql",
+            side_effect=[
+                {"data": {"node": {"comments": {"nodes": [{"id": "C_9"}]}}}},
+                {"data": {"addPullRequestReviewComment": {}}},
+            ],
+        )
+
+        result, _ = reply_to_thread("PRRT_1", "Done", "PR_1")
+
+        assert result.success
+        assert graphql.call_args.args[1]["commentId"] == "C_9"
+
+    def test_returns_pending_review(self, mocker: Any) -> None:
+        """reply_to_thread reports the pending review the reply was added to."""
+        mocker.patch(
+            "workflow_tools.pr.api.gh_api_graphql",
+            return_value={
+                "data": {
+                    "addPullRequestReviewComment": {
+                        "comment": {
+                            "id": "C_2",
+                            "pullRequestReview": {"id": "PRR_1", "state": "PENDING"},
+                        }
+                    }
+                }
+            },
+        )
+
+        _, pending_review_id = reply_to_thread(
+            "PRRT_1", "Done", "PR_1", comment_id="C_1"
+        )
+
+        assert pending_review_id == "PRR_1"
+
+
+class TestResolveThreads:
+    """Tests for resolve_threads function."""
+
+    def test_resolves_all_in_one_request(self, mocker: Any) -> None:
+        """resolve_threads sends a single aliased mutation."""
+        graphql = mocker.patch(
+            "workflow_tools.pr.api.gh_api_graphql",
+            return_value={
+                "data": {
+                    "t0": {"thread": {"isResolved": True}},
+                    "t1": {"thread": {"isResolved": True}},
+                }
+            },
+        )
+
+        results = resolve_threads(["PRRT_a", "PRRT_b"])
+
+        graphql.assert_called_once()
+        assert graphql.call_args.args[1] == {"t0": "PRRT_a", "t1": "PRRT_b"}
+        assert [r.success for r in results] == [True, True]
+        assert results[1].message == "Resolved thread PRRT_b"
+
+    def test_falls_back_per_thread_on_failure(self, mocker: Any) -> None:
+        """resolve_threads retries individually when the batch fails."""
+        graphql = mocker.patch(
+            "workflow_tools.pr.api.gh_api_graphql",
+            side_effect=[None, {"data": {}}, None],
+        )
+
+        results = resolve_threads(["PRRT_a", "PRRT_b"])
+
+        assert graphql.call_count == 3
+        assert [r.success for r in results] == [True, False]
+
+
 class TestFormatDate:
     """Tests for format_date function."""
 
@@ -191,6 +473,16 @@ class TestFormatDate:
         result = format_date("2024-01-15T10:30:00Z")
         assert result == "2024-01-15 10:30"
 
+    def test_formats_offset_date(self) -> None:
+        """format_date handles timestamps with an explicit UTC offset."""
+        result = format_date("2024-01-15T10:30:00+02:00")
+        assert result == "2024-01-15 10:30"
+
+    def test_rejects_date_shaped_garbage(self) -> None:
+        """format_date leaves malformed 20-character strings alone."""
+        result = format_date("abcdefghijTklmnopqrZ")
+        assert result == "abcdefghijTklmnopqrZ"
+
     def test_handles_invalid_date(self) -> None:
         """format_date returns input for invalid dates."""
         result = format_date("not a date")
@@ -0,0 +1,325 @@
+"""Tests for PR CLI helpers."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from workflow_tools.common.github import CURRENT_OWNER, CURRENT_REPO
+from workflow_tools.pr.api import (
+    ActionResult,
+    PRSummary,
+    ReviewThread,
+    ThreadComment,
+)
+from workflow_tools.pr.cli import (
+    cli,
+    get_pr_and_repo_or_exit,
+    get_pr_context_or_exit,
+    get_session_threads,
+    thread_preview,
+)
+
+
+class TestGetPrAndRepoOrExit:
+    """Tests for get_pr_and_repo_or_exit function."""
+
+    def test_returns_pr_and_repo(self, mocker: Any) -> None:
+        """get_pr_and_repo_or_exit returns both lookups."""
+        pr = MagicMock(number=12)
+        get_pr = mocker.patch(
+            "workflow_tools.pr.cli.get_pr_for_branch", return_value=pr
+        )
+        mocker.patch("workflow_tools.pr.cli.require_repo_info", return_value=("o", "r"))
+
+        assert get_pr_and_repo_or_exit(None, 12) == (pr, ("o", "r"))
+        get_pr.assert_called_once_with(12)
+
+    def test_exits_when_pr_missing(self, mocker: Any) -> None:
+        """get_pr_and_repo_or_exit exits when there is no PR."""
+        mocker.patch("workflow_tools.pr.cli.get_pr_for_branch", return_value=None)
+        mocker.patch("workflow_tools.pr.cli.get_current_branch", return_value="topic")
+        mocker.patch("workflow_tools.pr.cli.require_repo_info", return_value=("o", "r"))
+
+        with pytest.raises(SystemExit):
+            get_pr_and_repo_or_exit(None)
+
+    def test_reuses_session_pr(self, mocker: Any) -> None:
+        """get_pr_and_repo_or_exit skips the lookup for the session's PR."""
+        pr = MagicMock(number=12)
+        get_pr = mocker.patch("workflow_tools.pr.cli.get_pr_for_branch")
+        repo_info = mocker.patch("workflow_tools.pr.cli.require_repo_info")
+
+        assert get_pr_and_repo_or_exit(None, 12, pr) == (
+            pr,
+            (CURRENT_OWNER, CURRENT_REPO),
+        )
+        get_pr.assert_not_called()
+        repo_info.assert_not_called()
+
+    def test_looks_up_other_pr(self, mocker: Any) -> None:
+        """get_pr_and_repo_or_exit ignores a session PR with another number."""
+        other = MagicMock(number=13)
+        get_pr = mocker.patch(
+            "workflow_tools.pr.cli.get_pr_for_branch", return_value=other
+        )
+        mocker.patch("workflow_tools.pr.cli.require_repo_info", return_value=("o", "r"))
+
+        assert get_pr_and_repo_or_exit(13, 12, MagicMock(number=12))[0] is other
+        get_pr.assert_called_once_with(13)
+
+
+class TestGetPrContextOrExit:
+    """Tests for get_pr_context_or_exit function."""
+
+    def test_uses_current_repo_placeholders(self, mocker: Any) -> None:
+        """get_pr_context_or_exit lets gh fill in owner/repo."""
+        context = (MagicMock(), [], [])
+        full = mocker.patch(
+            "workflow_tools.pr.cli.get_pr_full_context", return_value=context
+        )
+
+        assert get_pr_context_or_exit(3) == context
+        full.assert_called_once_with("{owner}", "{repo}", 3)
+
+    def test_exits_when_missing(self, mocker: Any) -> None:
+        """get_pr_context_or_exit exits when the PR can't be fetched."""
+        mocker.patch("workflow_tools.pr.cli.get_pr_full_context", return_value=None)
+
+        with pytest.raises(SystemExit):
+            get_pr_context_or_exit(404)
+
+
+def _thread(body: str | None) -> ReviewThread:
+    comments = [] if body is None else [ThreadComment("C", "a", body, "", None)]
+    return ReviewThread("T", "f.py", 1, None, False, False, comments)
+
+
+class TestThreadPreview:
+    """Tests for thread_preview function."""
+
+    def test_short_body_on_one_line(self) -> None:
+        """thread_preview flattens newlines in short bodies."""
+        assert thread_preview(_thread("fix\nthis"), 40) == "fix this"
+
+    def test_flattens_crlf_and_tabs(self) -> None:
+        """thread_preview replaces carriage returns and tabs as well."""
+        assert thread_preview(_thread("a\r\nb\tc"), 40) == "a  b c"
+
+    def test_truncates_long_body(self) -> None:
+        """thread_preview truncates and adds an ellipsis."""
+        assert thread_preview(_thread("abcdef"), 3) == "abc..."
+
+    def test_no_comments(self) -> None:
+        """thread_preview returns an empty string without comments."""
+        assert thread_preview(_thread(None), 40) == ""
+
+
+class TestListCmd:
+    """Tests for the list command."""
+
+    def test_plain_output(self, mocker: Any) -> None:
+        """list prints one line per PR with styling stripped for pipes."""
+        mocker.patch(
+            "workflow_tools.pr.cli.list_open_prs",
+            return_value=[
+                PRSummary(7, "PR_7", "Add {x}", "u", "alice", "feat", True),
+                PRSummary(8, "PR_8", "Fix", "u", "bob", "fix", False),
+            ],
+        )
+
+        result = CliRunner().invoke(cli, ["list"])
+
+        assert result.exit_code == 0
+        assert result.output == (
+            "  #7 [draft] feat - Add {x} @alice\n  #8 fix - Fix @bob\n"
+        )
+
+    def test_json_keeps_full_field_set(self, mocker: Any) -> None:
+        """list --json emits the same keys per PR as before the PRSummary split."""
+        mocker.patch(
+            "workflow_tools.pr.cli.list_open_prs",
+            return_value=[PRSummary(7, "PR_7", "Add", "u", "alice", "feat", True)],
+        )
+
+        result = CliRunner().invoke(cli, ["list", "--json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output) == [
+            {
+                "number": 7,
+                "id": "PR_7",
+                "title": "Add",
+                "body": None,
+                "url": "u",
+                "state": "OPEN",
+                "author": "alice",
+                "base_branch": "",
+                "head_branch": "feat",
+                "is_draft": True,
+                "mergeable": None,
+                "review_decision": None,
+                "additions": 0,
+                "deletions": 0,
+                "changed_files": 0,
+            }
+        ]
+
+
+class TestGetSessionThreads:
+    """Tests for get_session_threads function."""
+
+    def test_reuses_cached_threads(self, mocker: Any) -> None:
+        """get_session_threads returns a copy of the session's threads."""
+        fetch = mocker.patch("workflow_tools.pr.cli.get_review_threads")
+        threads = [_thread("hi")]
+        ctx = MagicMock(obj={"threads": (3, threads)})
+
+        result = get_session_threads(ctx, "o", "r", 3)
+
+        assert result == threads
+        assert result is not threads
+        fetch.assert_not_called()
+
+    def test_fetches_for_other_pr(self, mocker: Any) -> None:
+        """get_session_threads ignores threads cached for a different PR."""
+        fetch = mocker.patch(
+            "workflow_tools.pr.cli.get_review_threads", return_value=[]
+        )
+        ctx = MagicMock(obj={"threads": (3, [_thread("hi")])})
+
+        assert get_session_threads(ctx, "o", "r", 4) == []
+        fetch.assert_called_once_with("o", "r", 4)
+
+
+class TestDiffCmd:
+    """Tests for the diff command."""
+
+    def test_gh_failure_exits_nonzero(self, mocker: Any) -> None:
+        """diff reports gh's stderr and exits 1 when gh fails."""
+        mocker.patch(
+            "workflow_tools.pr.cli.get_pr_or_exit", return_value=MagicMock(number=3)
+        )
+
+        def failing_diff(_pr_num: int) -> Iterator[str]:
+            yield "partial\n"
+            raise subprocess.CalledProcessError(1, ["gh"], stderr="HTTP 401\n")
+
+        mocker.patch("workflow_tools.pr.cli.iter_pr_diff", side_effect=failing_diff)
+
+        result = CliRunner().invoke(cli, ["diff"])
+
+        assert result.exit_code == 1
+        assert "partial" in result.output
+        assert "Failed to get diff for PR #3" in result.output
+        assert "HTTP 401" in result.output
+
+
+class TestResolveCmd:
+    """Tests for the resolve command."""
+
+    def test_all_resolves_unresolved_threads(self, mocker: Any) -> None:
+        """resolve --all fetches threads once and resolves the open ones."""
+        mocker.patch(
+            "workflow_tools.pr.cli.get_pr_and_repo_or_exit",
+            return_value=(MagicMock(number=3), ("o", "r")),
+        )
+        fetch = mocker.patch(
+            "workflow_tools.pr.cli.get_review_threads",
+            return_value=[
+                ReviewThread("T1", "f.py", 1, None, False, False, []),
+                ReviewThread("T2", "f.py", 2, None, True, False, []),
+            ],
+        )
+        batch = mocker.patch("workflow_tools.pr.cli.resolve_threads", return_value=[])
+
+        result = CliRunner().invoke(cli, ["resolve", "--all"])
+
+        assert result.exit_code == 0
+        fetch.assert_called_once_with("o", "r", 3)
+        batch.assert_called_once_with(["T1"])
+
+
+class TestReplyCmd:
+    """Tests for the reply command."""
+
+    def test_resolve_runs_with_submit(self, mocker: Any) -> None:
+        """reply --resolve submits the review and resolves the thread."""
+        mocker.patch(
+            "workflow_tools.pr.cli.get_pr_and_repo_or_exit",
+            return_value=(MagicMock(id="PR_1", number=1), ("o", "r")),
+        )
+        mocker.patch(
+            "workflow_tools.pr.cli.reply_to_thread",
+            return_value=(ActionResult(success=True, message="Replied"), "PRR_1"),
+        )
+        submit = mocker.patch(
+            "workflow_tools.pr.cli.submit_pending_review",
+            return_value=ActionResult(success=True, message="Submitted"),
+        )
+        resolve_one = mocker.patch(
+            "workflow_tools.pr.cli.resolve_thread",
+            return_value=ActionResult(success=True, message="Resolved"),
+        )
+
+        result = CliRunner().invoke(cli, ["reply", "T1", "Done", "--resolve"])
+
+        assert result.exit_code == 0
+        submit.assert_called_once_with("PR_1", "PRR_1")
+        resolve_one.assert_called_once_with("T1")
+        assert "Replied" in result.output
+        assert "Resolved" in result.output
+
+    def test_skips_submit_without_pending_review(self, mocker: Any) -> None:
+        """reply doesn't submit when the reply wasn't added to a pending review."""
+        mocker.patch(
+            "workflow_tools.pr.cli.get_pr_and_repo_or_exit",
+            return_value=(MagicMock(id="PR_1", number=1), ("o", "r")),
+        )
+        mocker.patch(
+            "workflow_tools.pr.cli.reply_to_thread",
+            return_value=(ActionResult(success=True, message="Replied"), None),
+        )
+        submit = mocker.patch("workflow_tools.pr.cli.submit_pending_review")
+
+        result = CliRunner().invoke(cli, ["reply", "T1", "Done"])
+
+        assert result.exit_code == 0
+        submit.assert_not_called()
+
+
+class TestInteractiveMode:
+    """Tests for the interactive PR menu."""
+
+    def test_refreshes_unresolved_count(self, mocker: Any) -> None:
+        """The threads entry is recounted after an action drops the session copy."""
+        open_thread = ReviewThread("T1", "f.py", 1, None, False, False, [])
+        mocker.patch(
+            "workflow_tools.pr.cli.get_pr_context_or_exit",
+            return_value=(MagicMock(number=3, is_draft=False), [open_thread], []),
+        )
+        mocker.patch("workflow_tools.pr.cli.get_review_threads", return_value=[])
+        menus: list[list[str]] = []
+
+        def pick(options: list[str], message: str) -> int:
+            menus.append(options)
+            if len(menus) == 1:
+                click.get_current_context().obj.pop("threads")
+                return 2  # View files
+            return len(options) - 1  # Quit
+
+        mocker.patch("workflow_tools.pr.cli.fuzzy_select", side_effect=pick)
+        mocker.patch("workflow_tools.pr.cli.get_pr_files", return_value=[])
+
+        result = CliRunner().invoke(cli, ["-p", "3"])
+
+        assert result.exit_code == 0
+        assert menus[0][1] == "[t] View threads (1 unresolved)"
+        assert menus[1][1] == "[t] View threads (0 unresolved)"
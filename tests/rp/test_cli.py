@@ -0,0 +1,246 @@
+"""Tests for the rp CLI."""
+
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from click.testing import CliRunner
+
+from workflow_tools.common.git import git_bin
+from workflow_tools.rp.cli import (
+    _global_ssh_command,
+    cli,
+    format_repo_options,
+    select_directory,
+    ssh_clone,
+    tilde_path,
+)
+
+
+class TestCloneCmd:
+    """Tests for the clone command."""
+
+    def test_all_clones_each_uncloned_repo(self, tmp_path: Path, mocker: Any) -> None:
+        """clone --all clones every repo that isn't already local."""
+        mocker.patch(
+            "workflow_tools.rp.cli.run_gh_json",
+            return_value=[
+                {"name": "one", "url": "u1", "description": ""},
+                {"name": "two", "url": "u2", "description": ""},
+                {"name": "here", "url": "u3", "description": ""},
+            ],
+        )
+        mocker.patch(
+            "workflow_tools.rp.cli.discover_repos", return_value=[tmp_path / "here"]
+        )
+        clone_repo = mocker.patch(
+            "workflow_tools.rp.cli.clone_repo", side_effect=lambda n, p: n == "one"
+        )
+
+        result = CliRunner().invoke(cli, ["clone", "--all", "-p", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert sorted(c.args for c in clone_repo.call_args_list) == [
+            ("one", tmp_path / "one"),
+            ("two", tmp_path / "two"),
+        ]
+        assert f"Cloned one to {tmp_path / 'one'}" in result.output
+        assert "Failed to clone two" in result.output
+
+    @pytest.mark.parametrize(
+        ("exists", "succeeds", "cds"),
+        [(False, True, True), (False, False, False), (True, True, False)],
+    )
+    def test_single_repo_cds_only_after_successful_clone(
+        self, tmp_path: Path, mocker: Any, *, exists: bool, succeeds: bool, cds: bool
+    ) -> None:
+        """clone cds into a single repo only when its clone succeeded."""
+        if exists:
+            (tmp_path / "one").mkdir()
+        mocker.patch(
+            "workflow_tools.rp.cli.run_gh_json",
+            return_value=[{"name": "one", "url": "u1", "description": ""}],
+        )
+        mocker.patch("workflow_tools.rp.cli.discover_repos", return_value=[])
+        mocker.patch("workflow_tools.rp.cli.clone_repo", return_value=succeeds)
+        mocker.patch("workflow_tools.rp.cli.setup_repo_direnv")
+        output_cd = mocker.patch("workflow_tools.rp.cli.output_cd")
+
+        result = CliRunner().invoke(cli, ["clone", "one", "-p", str(tmp_path)])
+
+        assert result.exit_code == 0
+        assert output_cd.called is cds
+
+    def test_lists_past_first_hundred_repos(self, mocker: Any) -> None:
+        """clone asks gh for more than its first page of repos."""
+        run_gh_json = mocker.patch(
+            "workflow_tools.rp.cli.run_gh_json", return_value=None
+        )
+        mocker.patch("workflow_tools.rp.cli.discover_repos", return_value=[])
+
+        result = CliRunner().invoke(cli, ["clone", "anything"])
+
+        assert result.exit_code == 1
+        args = run_gh_json.call_args.args
+        assert args[args.index("--limit") + 1] == "1000"
+
+
+class TestFormatRepoOptions:
+    """Tests for format_repo_options function."""
+
+    def test_aligns_names_and_shortens_home(self) -> None:
+        """format_repo_options pads names and shows home as ~."""
+        home = Path.home()
+        repos = [home / "code" / "a", home / "code" / "longer"]
+
+        assert format_repo_options(repos) == [
+            "a       ~/code/a",
+            "longer  ~/code/longer",
+        ]
+
+
+class TestTildePath:
+    """Tests for tilde_path function."""
+
+    def test_shortens_only_a_leading_home(self) -> None:
+        """tilde_path replaces home only as a whole leading path prefix."""
+        home = Path.home()
+
+        assert tilde_path(home / "code") == "~/code"
+        assert tilde_path(home) == "~"
+        assert tilde_path(Path(f"{home}2") / "code") == f"{home}2/code"
+        assert tilde_path(Path("/srv") / str(home).lstrip("/")) == f"/srv{home}"
+
+
+class TestSelectDirectory:
+    """Tests for select_directory function."""
+
+    def test_offers_base_and_visible_subdirs(self, tmp_path: Path, mocker: Any) -> None:
+        """select_directory lists sorted subdirs, following symlinks to dirs."""
+        for name in ("b", "a", ".hidden"):
+            (tmp_path / name).mkdir()
+        (tmp_path / "file.txt").write_text("")
+        (tmp_path / "link").symlink_to(tmp_path / "a")
+        select = mocker.patch("workflow_tools.rp.cli.fuzzy_select", return_value=3)
+
+        assert select_directory("Clone to", [tmp_path]) == tmp_path / "link"
+        options = select.call_args.args[0]
+        assert options[:-1] == [
+            tilde_path(tmp_path / name) for name in ("", "a", "b", "link")
+        ]
+
+
+@pytest.fixture
+def _fresh_ssh_config() -> Iterator[None]:
+    """Forget the global core.sshCommand read by an earlier test."""
+    _global_ssh_command.cache_clear()
+    yield
+    _global_ssh_command.cache_clear()
+
+
+@pytest.mark.usefixtures("_fresh_ssh_config")
+class TestSshClone:
+    """Tests for ssh_clone function."""
+
+    def test_sets_connect_timeout(
+        self, tmp_path: Path, mocker: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ssh_clone bounds the SSH connect time when no ssh command is set."""
+        monkeypatch.delenv("GIT_SSH_COMMAND", raising=False)
+        monkeypatch.delenv("GIT_SSH", raising=False)
+        run_git = mocker.patch("workflow_tools.rp.cli.run_git", return_value=None)
+        run = mocker.patch("workflow_tools.rp.cli.subprocess.run")
+        run.return_value.returncode = 0
+
+        assert ssh_clone("git@github.com:o/r.git", tmp_path / "r")
+        assert ssh_clone("git@github.com:o/s.git", tmp_path / "s")
+
+        run_git.assert_called_once_with(
+            "config", "--global", "--get", "core.sshCommand"
+        )
+
+        assert run.call_args.args[0][0] == git_bin()
+        env = run.call_args.kwargs["env"]
+        assert env["GIT_SSH_COMMAND"] == "ssh -o ConnectTimeout=10"
+
+    def test_keeps_user_ssh_command(
+        self, tmp_path: Path, mocker: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ssh_clone leaves a configured ssh command in charge."""
+        monkeypatch.setenv("GIT_SSH_COMMAND", "ssh -i key")
+        run = mocker.patch("workflow_tools.rp.cli.subprocess.run")
+        run.return_value.returncode = 128
+
+        assert not ssh_clone("git@github.com:o/r.git", tmp_path / "r")
+        assert run.call_args.kwargs["env"] is None
+
+
+class TestListCmd:
+    """Tests for the list command."""
+
+    def test_aligned_rows(self, tmp_path: Path, mocker: Any) -> None:
+        """list prints padded names followed by paths."""
+        mocker.patch(
+            "workflow_tools.rp.cli.discover_repos",
+            return_value=[tmp_path / "a", tmp_path / "{b}"],
+        )
+
+        result = CliRunner().invoke(cli, ["list"])
+
+        assert result.exit_code == 0
+        assert result.output == f"  a   {tmp_path}/a\n  {{b}} {tmp_path}/{{b}}\n"
+
+
+class TestRenameCmd:
+    """Tests for the rename command."""
+
+    def test_github_only_skips_discovery(self, mocker: Any) -> None:
+        """rename --github-only never scans for local repos."""
+        locate = mocker.patch("workflow_tools.rp.cli.locate_repo")
+        run_gh = mocker.patch("workflow_tools.rp.cli.run_gh", return_value="")
+
+        result = CliRunner().invoke(cli, ["rename", "old", "new", "--github-only"])
+
+        assert result.exit_code == 0
+        locate.assert_not_called()
+        run_gh.assert_called_once_with("repo", "rename", "new", "-y")
+
+    def test_local_only_renames_directory(self, tmp_path: Path, mocker: Any) -> None:
+        """rename --local-only moves the located repo and cds into it."""
+        old = tmp_path / "old"
+        old.mkdir()
+        mocker.patch("workflow_tools.rp.cli.locate_repo", return_value=old)
+
+        result = CliRunner().invoke(cli, ["rename", "old", "new", "--local-only"])
+
+        assert result.exit_code == 0
+        assert (tmp_path / "new").is_dir()
+        assert not old.exists()
+
+
+class TestCreateCmd:
+    """Tests for the create command."""
+
+    def test_failed_clone_into_existing_dir_fails(
+        self, tmp_path: Path, mocker: Any
+    ) -> None:
+        """create reports failure from the clone exit codes, not the directory."""
+        (tmp_path / "proj").mkdir()
+        mocker.patch(
+            "workflow_tools.rp.cli.run_gh",
+            return_value="https://github.com/me/proj\n",
+        )
+        mocker.patch("workflow_tools.rp.cli.ssh_clone", return_value=False)
+        mocker.patch(
+            "workflow_tools.rp.cli.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 1),
+        )
+
+        result = CliRunner().invoke(cli, ["create", "proj", "-p", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert "Clone failed" in result.output
@@ -5,7 +5,7 @@ from __future__ import annotations
 import subprocess
 from pathlib import Path
 
-from workflow_tools.rp.discovery import discover_repos, find_repo
+from workflow_tools.rp.discovery import discover_repos, find_repo, locate_repo
 
 
 class TestDiscoverRepos:
@@ -67,6 +67,38 @@ class TestDiscoverRepos:
 
         assert len(repos) == 1
 
+    def test_respects_max_depth(self, tmp_path: Path) -> None:
+        """discover_repos finds repos two levels down but not three."""
+        for parts in (("a", "b", "shallow"), ("a", "b", "c", "deep")):
+            repo = tmp_path.joinpath(*parts)
+            repo.mkdir(parents=True)
+            (repo / ".git").mkdir()
+
+        repos = discover_repos([tmp_path])
+
+        assert [r.name for r in repos] == []
+        assert [r.name for r in discover_repos([tmp_path / "a"])] == ["shallow"]
+
+    def test_finds_nested_repos(self, tmp_path: Path) -> None:
+        """discover_repos keeps scanning inside a repo for nested repos."""
+        outer = tmp_path / "outer"
+        (outer / ".git").mkdir(parents=True)
+        (outer / "inner" / ".git").mkdir(parents=True)
+
+        repos = discover_repos([tmp_path])
+
+        assert [r.name for r in repos] == ["inner", "outer"]
+
+    def test_skips_dependency_dirs(self, tmp_path: Path) -> None:
+        """discover_repos does not look inside node_modules or virtualenvs."""
+        (tmp_path / "app" / ".git").mkdir(parents=True)
+        (tmp_path / "app" / "node_modules" / "dep" / ".git").mkdir(parents=True)
+        (tmp_path / "node_modules" / "dep" / ".git").mkdir(parents=True)
+
+        repos = discover_repos([tmp_path])
+
+        assert [r.name for r in repos] == ["app"]
+
 
 class TestFindRepo:
     """Tests for find_repo function."""
@@ -114,3 +146,30 @@ class TestFindRepo:
         found = find_repo("nonexistent", repos)
 
         assert found is None
+
+
+class TestLocateRepo:
+    """Tests for locate_repo function."""
+
+    def test_prefers_shallowest_match(self, tmp_path: Path) -> None:
+        """locate_repo returns the same repo as find_repo over discover_repos."""
+        (tmp_path / "Tool" / ".git").mkdir(parents=True)
+        (tmp_path / "nested" / "tool" / ".git").mkdir(parents=True)
+
+        found = locate_repo("TOOL", [tmp_path])
+
+        assert found == tmp_path / "Tool"
+        assert found == find_repo("TOOL", discover_repos([tmp_path]))
+
+    def test_finds_by_path(self, tmp_path: Path) -> None:
+        """locate_repo matches a full path."""
+        repo = tmp_path / "a" / "repo"
+        (repo / ".git").mkdir(parents=True)
+
+        assert locate_repo(str(repo), [tmp_path]) == repo
+
+    def test_returns_none_when_missing(self, tmp_path: Path) -> None:
+        """locate_repo returns None when nothing matches."""
+        (tmp_path / "repo" / ".git").mkdir(parents=True)
+
+        assert locate_repo("other", [tmp_path]) is None
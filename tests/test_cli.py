@@ -0,0 +1,135 @@
+"""Tests for the top-level workflow-tools CLI."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from workflow_tools.cli import cli
+
+
+@pytest.fixture
+def fake_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point HOME at an empty temp directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    return tmp_path
+
+
+class TestInstall:
+    """Tests for the install command."""
+
+    def test_writes_integration_file_and_sources_it(self, fake_home: Path) -> None:
+        """install writes the wrapper to a file that the rc file sources."""
+        with patch("workflow_tools.cli.copy_to_clipboard", return_value=False):
+            result = CliRunner().invoke(cli, ["install", "--shell", "zsh"])
+
+        assert result.exit_code == 0
+        integration = fake_home / ".config" / "workflow-tools" / "shell-integration.sh"
+        assert "wt() {" in integration.read_text()
+        zshrc = (fake_home / ".zshrc").read_text()
+        assert "workflow-tools/shell-integration.sh" in zshrc
+        assert "install --print" not in zshrc
+
+    def test_rewrites_legacy_eval_line(self, fake_home: Path) -> None:
+        """install replaces the old eval line with a source of the static file."""
+        bashrc = fake_home / ".bashrc"
+        bashrc.write_text(
+            'alias ll="ls -l"\n  eval "$(workflow-tools install --print)"\nset -o vi\n'
+        )
+
+        with patch("workflow_tools.cli.copy_to_clipboard", return_value=False):
+            result = CliRunner().invoke(cli, ["install", "--shell", "bash"])
+
+        assert result.exit_code == 0
+        integration = "$HOME/.config/workflow-tools/shell-integration.sh"
+        assert bashrc.read_text() == (
+            'alias ll="ls -l"\n'
+            f'  [ -f "{integration}" ] && source "{integration}"\n'
+            "set -o vi\n"
+        )
+
+    def test_second_install_leaves_rc_file(self, fake_home: Path) -> None:
+        """install does not add a second block once the rc file sources it."""
+        with patch("workflow_tools.cli.copy_to_clipboard", return_value=False):
+            CliRunner().invoke(cli, ["install", "--shell", "zsh"])
+            before = (fake_home / ".zshrc").read_text()
+            result = CliRunner().invoke(cli, ["install", "--shell", "zsh"])
+
+        assert "Already installed" in result.output
+        assert (fake_home / ".zshrc").read_text() == before
+
+    def test_print_outputs_wrapper(self, fake_home: Path) -> None:
+        """install --print still prints the wrapper without writing files."""
+        result = CliRunner().invoke(cli, ["install", "--shell", "bash", "--print"])
+
+        assert result.exit_code == 0
+        assert "rp() {" in result.output
+        assert not (fake_home / ".config").exists()
+
+
+class TestUpdate:
+    """Tests for the update command."""
+
+    def test_refreshes_integration_file(self, fake_home: Path) -> None:
+        """update rewrites the integration file from the reinstalled binary."""
+        integration = fake_home / ".config" / "workflow-tools" / "shell-integration.sh"
+        integration.parent.mkdir(parents=True)
+        integration.write_text("# stale wrapper\n")
+
+        def fake_run(args: list[str], **_: object) -> subprocess.CompletedProcess[str]:
+            stdout = "# new wrapper\n" if args[1:] == ["install", "--print"] else ""
+            return subprocess.CompletedProcess(args, 0, stdout=stdout)
+
+        with patch("workflow_tools.cli.subprocess.run", side_effect=fake_run):
+            result = CliRunner().invoke(cli, ["update"])
+
+        assert result.exit_code == 0
+        assert integration.read_text() == "# new wrapper\n"
+
+    def test_skips_refresh_when_not_installed(self, fake_home: Path) -> None:
+        """update does not create an integration file install never wrote."""
+        with patch(
+            "workflow_tools.cli.subprocess.run",
+            return_value=subprocess.CompletedProcess([], 0, stdout=""),
+        ) as run:
+            result = CliRunner().invoke(cli, ["update"])
+
+        assert result.exit_code == 0
+        assert run.call_count == 1
+        assert not (fake_home / ".config").exists()
+
+
+class TestLazyGroup:
+    """Tests for lazily loaded subcommands."""
+
+    def test_help_does_not_import_tools(self) -> None:
+        """--help lists the tools without importing their modules."""
+        code = (
+            "import sys\n"
+            "from workflow_tools.cli import cli\n"
+            "try:\n"
+            "    cli.main(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in sys.modules if m.endswith('.cli')))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert "wt       Git worktree manager" in result.stdout
+        assert result.stdout.splitlines()[-1] == "['workflow_tools.cli']"
+
+    def test_stored_help_matches_commands(self) -> None:
+        """Each stored short help matches the loaded command's own."""
+        ctx = click.Context(cli)
+        for name, (_, short_help) in cli.lazy_subcommands.items():
+            command = cli.get_command(ctx, name)
+            assert command is not None
+            assert command.get_short_help_str(limit=200) == short_help